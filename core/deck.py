@@ -54,6 +54,11 @@ class Card:
     # Class constants for suit ordering
     SUIT_ORDER = {"S": 4, "H": 3, "D": 2, "C": 1}  # For comparison
     
+    # Suit position in a displayed hand (alphabetical: clubs first)
+    SUIT_SORT_ORDER = {"C": 0, "D": 1, "H": 2, "S": 3}
+    
+    __slots__ = ('suit', 'value', 'sort_key')
+    
     def __init__(self, suit: str, value: int):
         """
         Initialize a card.
@@ -69,6 +74,8 @@ class Card:
             
         self.suit = suit
         self.value = value
+        # Display order used for hands as a single int: by suit, highest card first
+        self.sort_key = (self.SUIT_SORT_ORDER[suit] << 4) | (15 - value)
         
     @property
     def value_name(self) -> str:
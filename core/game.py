@@ -6,12 +6,18 @@ This module defines the main game logic for the Bridge card game.
 
 import logging
 from enum import Enum, auto
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Dict, Optional, Union, Tuple
 from core.deck import Deck, Card
+from core.hand_evaluation import calculate_hcp, count_suit_length
 
 # Set up logger
 logger = logging.getLogger("BridgeGame.Core")
 
+# Sort key for hands: suits in bridge order, highest card first within a suit
+_card_sort_key = attrgetter('sort_key')
+
 class BidType(Enum):
     """Types of bids that can be made in bridge."""
     PASS = auto()
@@ -27,7 +33,13 @@ class Vulnerability(Enum):
     BOTH = auto()
 
 class Bid:
-    """Representation of a bridge bid."""
+    """Representation of a bridge bid.
+
+    Bids are not changed after creation, so from_string can hand out the
+    same object for the same string.
+    """
+    
+    __slots__ = ('bid_type', 'level', 'denomination', 'rank')
     
     # Class constants for denominations
     DENOMINATIONS = {
@@ -47,9 +59,10 @@ class Bid:
             level: The level of the bid (1-7) - required for NORMAL bids
             denomination: The denomination of the bid (C, D, H, S, NT) - required for NORMAL bids
         """
-        self.bid_type = bid_type
-        self.level = level
-        self.denomination = denomination
+        # Bids are immutable (see __setattr__), so the slots are set directly
+        object.__setattr__(self, 'bid_type', bid_type)
+        object.__setattr__(self, 'level', level)
+        object.__setattr__(self, 'denomination', denomination)
         
         # Validate inputs
         if bid_type == BidType.NORMAL:
@@ -61,6 +74,23 @@ class Bid:
                 raise ValueError(f"Invalid denomination: {denomination}")
         elif bid_type != BidType.PASS and (level is not None or denomination is not None):
             logger.warning(f"Level and denomination ignored for {bid_type} bid")
+        
+        # Rank used to compare bids, worked out once (see get_rank)
+        if bid_type == BidType.NORMAL:
+            rank = (level * 5) + self.DENOMINATIONS[denomination]['rank']
+        elif bid_type == BidType.PASS:
+            rank = 0
+        else:
+            rank = -1
+        object.__setattr__(self, 'rank', rank)
+    
+    def __setattr__(self, name, value):
+        """Refuse changes: from_string hands out the same Bid to every caller."""
+        raise AttributeError(f"Bid is immutable, cannot set {name}")
+    
+    def __delattr__(self, name):
+        """Refuse deletions, as for __setattr__."""
+        raise AttributeError(f"Bid is immutable, cannot delete {name}")
     
     def __str__(self) -> str:
         """Return string representation of bid."""
@@ -115,16 +145,9 @@ class Bid:
                 return self.bid_type == BidType.DOUBLE
             return False
         
-        # Normal bid comparison
+        # Normal bid comparison: by level, then denomination, folded into the rank
         if other.bid_type == BidType.NORMAL:
-            # Compare levels first
-            if self.level < other.level:
-                return True
-            if self.level > other.level:
-                return False
-            
-            # Same level, compare denominations
-            return self.DENOMINATIONS[self.denomination]['rank'] < self.DENOMINATIONS[other.denomination]['rank']
+            return self.rank < other.rank
         
         # Normal bids are higher than Pass, but not directly comparable to Double/Redouble
         return False
@@ -146,14 +169,7 @@ class Bid:
                  Normal bids = (level * 5) + denomination_rank
                  Double and Redouble are special cases and not included
         """
-        if self.bid_type == BidType.PASS:
-            return 0
-        elif self.bid_type == BidType.NORMAL:
-            denom_rank = self.DENOMINATIONS[self.denomination]['rank']
-            return (self.level * 5) + denom_rank
-        
-        # Double and Redouble don't have a natural rank in this system
-        return -1
+        return self.rank
     
     @classmethod
     def from_string(cls, bid_str: str) -> 'Bid':
@@ -164,37 +180,47 @@ class Bid:
             bid_str: String representation of a bid (e.g., "1NT", "Pass", "Double")
             
         Returns:
-            Bid: A new Bid object
+            Bid: The Bid for the string, shared by calls with the same string
         """
-        bid_str = bid_str.strip()
-        
-        if bid_str.lower() == "pass":
-            return cls(BidType.PASS)
-        elif bid_str.lower() == "double":
-            return cls(BidType.DOUBLE)
-        elif bid_str.lower() == "redouble":
-            return cls(BidType.REDOUBLE)
+        # Parsed bids are cached; there are only 38 distinct bids
+        return _parse_bid(cls, bid_str.strip())
+
+# Bid types of the bids spelled as words, keyed by lower-case spelling
+_SPECIAL_BIDS = {
+    "pass": BidType.PASS,
+    "double": BidType.DOUBLE,
+    "redouble": BidType.REDOUBLE
+}
+
+# Suit symbols accepted in place of the denomination letters
+_SYMBOL_TO_LETTER = {'♣': 'C', '♦': 'D', '♥': 'H', '♠': 'S'}
+
+@lru_cache(maxsize=128)
+def _parse_bid(cls, bid_str: str) -> Bid:
+    """Parse a stripped bid string for Bid.from_string."""
+    special = _SPECIAL_BIDS.get(bid_str.lower())
+    if special is not None:
+        return cls(special)
+    else:
+        # Normal bid like "1NT" or "3H"
+        if len(bid_str) < 2:
+            raise ValueError(f"Invalid bid string: {bid_str}")
+        
+        # Extract level and denomination
+        level = int(bid_str[0])
+        
+        if bid_str[1:] == "NT":
+            denomination = "NT"
+        elif bid_str[1] in "CDHS":
+            denomination = bid_str[1]
         else:
-            # Normal bid like "1NT" or "3H"
-            if len(bid_str) < 2:
-                raise ValueError(f"Invalid bid string: {bid_str}")
-            
-            # Extract level and denomination
-            level = int(bid_str[0])
-            
-            if bid_str[1:] == "NT":
-                denomination = "NT"
-            elif bid_str[1] in "CDHS":
-                denomination = bid_str[1]
+            # Try to convert symbols to letters
+            if bid_str[1] in _SYMBOL_TO_LETTER:
+                denomination = _SYMBOL_TO_LETTER[bid_str[1]]
             else:
-                # Try to convert symbols to letters
-                symbol_to_letter = {'♣': 'C', '♦': 'D', '♥': 'H', '♠': 'S'}
-                if bid_str[1] in symbol_to_letter:
-                    denomination = symbol_to_letter[bid_str[1]]
-                else:
-                    raise ValueError(f"Invalid denomination in bid: {bid_str}")
-            
-            return cls(BidType.NORMAL, level, denomination)
+                raise ValueError(f"Invalid denomination in bid: {bid_str}")
+        
+        return cls(BidType.NORMAL, level, denomination)
 
 class BridgeGame:
     """Main game class for Bridge card game."""
@@ -207,15 +233,18 @@ class BridgeGame:
         self.trick = []
         self.score = {"north-south": 0, "east-west": 0}
         self.contract = None
+        self.contract_display = None  # Contract with suit symbols, set with the contract
         self.current_state = "bidding"  # States: bidding, playing, game_over
         self.game_history = []
         self.last_trick_winner = None  # Track the winner of the last trick
         self.last_complete_trick = None  # Store the last complete trick for reference
+        self.last_winning_card = None  # Card that won the last complete trick
         
         # Bidding-related fields
         self.bidding_history = []        # List of all bids made
         self.current_bidder = 0          # Player who is currently bidding
         self.last_bid = None             # Last non-pass bid made
+        self.last_bidder = None          # Player who made last_bid
         self.double_status = "none"      # none, doubled, redoubled
         self.vulnerability = Vulnerability.NONE  # Vulnerability state
         self.declarer = None             # Player who will play the hand
@@ -255,12 +284,13 @@ class BridgeGame:
             if cards_count != 13:
                 logger.error(f"Player {i} has {cards_count} cards instead of 13!")
             
-            hand_str = ", ".join(str(card) for card in sorted(player["hand"], key=lambda c: (c.suit, -c.value)))
+            hand_str = ", ".join(str(card) for card in player["hand"])
             logger.info(f"Player {i} hand: {hand_str}")
         
         self.current_player = 0
         self.trick = []
         self.contract = None
+        self.contract_display = None
         self.current_state = "bidding"
         self.game_history = []
         self.last_trick_winner = None
@@ -269,6 +299,7 @@ class BridgeGame:
         self.bidding_history = []
         self.current_bidder = 0  # Dealer starts bidding
         self.last_bid = None
+        self.last_bidder = None
         self.double_status = "none"
         
         # Log the state of the game
@@ -311,6 +342,13 @@ class BridgeGame:
                 
                 self.players[player_idx]["hand"].append(card)
                 dealt_cards += 1
+            
+            # Sort once at the deal; removing played cards keeps the order
+            self.players[player_idx]["hand"].sort(key=_card_sort_key)
+            # Cards left in each suit, kept up to date by play_card
+            self.players[player_idx]["suit_counts"] = count_suit_length(self.players[player_idx]["hand"])
+            # High card points of the hand as dealt, for display and logging
+            self.players[player_idx]["hcp"] = calculate_hcp(self.players[player_idx]["hand"])
                 
         logger.info(f"Total cards dealt: {dealt_cards}")
         logger.info(f"Deck size after dealing: {len(self.deck.cards)}")
@@ -329,29 +367,34 @@ class BridgeGame:
         # Log the hands for debugging
         for player_idx, player in enumerate(self.players):
             try:
-                # Sort cards for more readable output
-                sorted_hand = sorted(player["hand"], key=lambda c: (c.suit, -c.value))
-                card_strs = [f"{card.value_name}{card.suit}" for card in sorted_hand]
+                # Hands are kept sorted, so the output is already readable
+                card_strs = [f"{card.value_name}{card.suit}" for card in player["hand"]]
                 hand_str = ", ".join(card_strs)
                 logger.info(f"Player {player_idx} was dealt: {hand_str}")
                 
                 # Log high card points for each hand
-                from core.hand_evaluation import calculate_hcp, count_suit_length
-                hcp = calculate_hcp(player["hand"])
-                suit_lengths = count_suit_length(player["hand"])
-                logger.info(f"Player {player_idx} hand - HCP: {hcp}, Distribution: {suit_lengths}")
+                logger.info(f"Player {player_idx} hand - HCP: {player['hcp']}, Distribution: {player['suit_counts']}")
             except Exception as e:
                 logger.error(f"Error logging hand for player {player_idx}: {e}")
                 logger.error(f"Raw hand: {player['hand']}")
     
     def start_bidding(self):
-        """Start the bidding phase."""
+        """Start the bidding phase, keeping the dealt hands.
+
+        Any contract from an earlier auction is cleared, so the same deal can
+        be bid again.
+        """
         self.current_state = "bidding"
         self.current_bidder = 0  # South starts as dealer
         self.current_player = self.current_bidder  # Set current player to bidder
         self.bidding_history = []
         self.last_bid = None
+        self.last_bidder = None
         self.double_status = "none"
+        self.contract = None
+        self.contract_display = None
+        self.declarer = None
+        self.dummy = None
     
     def place_bid(self, player_idx: int, bid: Union[Bid, str]) -> bool:
         """
@@ -387,6 +430,7 @@ class BridgeGame:
         # Update last_bid and double status if needed
         if bid.bid_type == BidType.NORMAL:
             self.last_bid = bid
+            self.last_bidder = player_idx
             self.double_status = "none"
         elif bid.bid_type == BidType.DOUBLE:
             self.double_status = "doubled"
@@ -422,22 +466,12 @@ class BridgeGame:
         # Double is valid only if the last non-pass bid was made by an opponent
         # and it has not been doubled already
         if bid.bid_type == BidType.DOUBLE:
-            if not self.last_bid:
-                return False  # No bid to double
-            
-            # Find the player who made the last non-pass bid
-            last_bidder = None
-            for entry in reversed(self.bidding_history):
-                if isinstance(entry["bid"], Bid) and entry["bid"].bid_type == BidType.NORMAL:
-                    last_bidder = entry["player"]
-                    break
-            
-            if last_bidder is None:
+            if not self.last_bid or self.last_bidder is None:
                 return False  # No bid to double
             
             # Check if last bidder is an opponent
             current_partnership = self.current_bidder % 2
-            last_bidder_partnership = last_bidder % 2
+            last_bidder_partnership = self.last_bidder % 2
             
             if current_partnership == last_bidder_partnership:
                 return False  # Can't double partner's bid
@@ -451,25 +485,18 @@ class BridgeGame:
             if self.double_status != "doubled":
                 return False  # Not doubled, can't redouble
             
-            # Find the player who made the last non-pass bid
-            last_bidder = None
-            for entry in reversed(self.bidding_history):
-                if isinstance(entry["bid"], Bid) and entry["bid"].bid_type == BidType.NORMAL:
-                    last_bidder = entry["player"]
-                    break
-            
-            if last_bidder is None:
+            if self.last_bidder is None:
                 return False
             
             # Check if last bidder is from the same partnership
             current_partnership = self.current_bidder % 2
-            last_bidder_partnership = last_bidder % 2
+            last_bidder_partnership = self.last_bidder % 2
             
             return current_partnership == last_bidder_partnership
         
-        # For normal bids, it must be higher than the last bid
+        # For normal bids, it must be higher than the last bid (always a normal bid)
         if self.last_bid:
-            return bid > self.last_bid
+            return bid.rank > self.last_bid.rank
         
         # First bid is always valid
         return True
@@ -483,15 +510,12 @@ class BridgeGame:
         """
         valid_bids = [Bid(BidType.PASS)]  # Pass is always valid
         
+        # The last non-pass bidder is tracked by place_bid, so there is no
+        # need to walk the bidding history for either check below
+        last_bidder = self.last_bidder
+        
         # Check if double is valid
         if self.last_bid and self.double_status == "none":
-            # Find the player who made the last non-pass bid
-            last_bidder = None
-            for entry in reversed(self.bidding_history):
-                if isinstance(entry["bid"], Bid) and entry["bid"].bid_type == BidType.NORMAL:
-                    last_bidder = entry["player"]
-                    break
-            
             if last_bidder is not None:
                 # Check if last bidder is an opponent
                 current_partnership = self.current_bidder % 2
@@ -502,13 +526,6 @@ class BridgeGame:
         
         # Check if redouble is valid
         if self.double_status == "doubled":
-            # Find the player who made the last non-pass bid
-            last_bidder = None
-            for entry in reversed(self.bidding_history):
-                if isinstance(entry["bid"], Bid) and entry["bid"].bid_type == BidType.NORMAL:
-                    last_bidder = entry["player"]
-                    break
-            
             if last_bidder is not None:
                 # Check if last bidder is from the same partnership
                 current_partnership = self.current_bidder % 2
@@ -521,7 +538,7 @@ class BridgeGame:
         for level in range(1, 8):
             for denom in ['C', 'D', 'H', 'S', 'NT']:
                 bid = Bid(BidType.NORMAL, level, denom)
-                if not self.last_bid or bid > self.last_bid:
+                if not self.last_bid or bid.rank > self.last_bid.rank:
                     valid_bids.append(bid)
         
         return valid_bids
@@ -537,10 +554,12 @@ class BridgeGame:
         if len(self.bidding_history) < 4:
             return False
         
+        # Double and Redouble require a prior normal bid, so last_bid alone
+        # tells us whether any non-pass bid has been made
+        has_contract_bid = self.last_bid is not None
+        
         # Check if first round of bidding and all passes
-        if len(self.bidding_history) == 4 and all(
-            entry["bid"].bid_type == BidType.PASS for entry in self.bidding_history
-        ):
+        if len(self.bidding_history) == 4 and not has_contract_bid:
             logger.info("Bidding complete: All players passed")
             return True
         
@@ -550,11 +569,6 @@ class BridgeGame:
             for entry in self.bidding_history[-3:]
         )
         
-        has_contract_bid = any(
-            entry["bid"].bid_type != BidType.PASS 
-            for entry in self.bidding_history
-        )
-        
         if last_three_passes and has_contract_bid:
             logger.info("Bidding complete: Last three bids were passes after a contract bid")
             return True
@@ -565,27 +579,18 @@ class BridgeGame:
         """Determine the final contract, declarer, and dummy from bidding history."""
         # Default: no contract (all passed)
         self.contract = None
+        self.contract_display = None
         self.declarer = None
         self.dummy = None
         
         # Check if everyone passed
-        if all(entry["bid"].bid_type == BidType.PASS for entry in self.bidding_history):
+        if self.last_bid is None:
             logger.info("All players passed - no contract")
             return
         
-        # Find the last non-pass bid (should be a normal bid)
-        last_normal_bid = None
-        last_normal_bidder = None
-        
-        for entry in reversed(self.bidding_history):
-            if entry["bid"].bid_type == BidType.NORMAL:
-                last_normal_bid = entry["bid"]
-                last_normal_bidder = entry["player"]
-                break
-        
-        if not last_normal_bid:
-            logger.error("No normal bid found in bidding history")
-            return
+        # The last normal bid and its bidder are tracked by place_bid
+        last_normal_bid = self.last_bid
+        last_normal_bidder = self.last_bidder
         
         # Determine the strain (denomination) of the contract
         strain = last_normal_bid.denomination
@@ -619,8 +624,9 @@ class BridgeGame:
         # Determine dummy (partner of declarer)
         dummy = (declarer + 2) % 4
         
-        # Set the game state
+        # Set the game state, with the display form worked out once for the auction
         self.contract = contract_str
+        self.contract_display = f"{level}{Bid.DENOMINATIONS[strain]['symbol']}{contract_suffix}"
         self.declarer = declarer
         self.dummy = dummy
         
@@ -642,16 +648,8 @@ class BridgeGame:
         if not self.contract:
             return "Pass"
         
-        # Replace denomination letter with symbol for display
-        if self.contract and len(self.contract) >= 2:
-            level = self.contract[0]
-            denom = self.contract[1]
-            
-            if denom in "CDHS":
-                symbol = {"C": "♣", "D": "♦", "H": "♥", "S": "♠"}[denom]
-                return level + symbol + self.contract[2:]
-        
-        return self.contract
+        # Formatted once by _finalize_contract when the auction ended
+        return self.contract_display
     
     def determine_declarer(self) -> Optional[int]:
         """
@@ -698,6 +696,7 @@ class BridgeGame:
         
         # Remove card from player's hand and add to current trick
         self.players[player_idx]["hand"].remove(card)
+        self.players[player_idx]["suit_counts"][card.suit] -= 1
         self.trick.append({"player": player_idx, "card": card})
         
         # Log the play
@@ -714,8 +713,9 @@ class BridgeGame:
         # If trick is complete (4 cards), determine winner
         if len(self.trick) == 4:
             # Print the complete trick for debugging
-            trick_log = [(i, p["player"], p["card"]) for i, p in enumerate(self.trick)]
-            logger.info(f"Trick complete: {trick_log}")
+            if logger.isEnabledFor(logging.DEBUG):
+                trick_log = [(i, p["player"], p["card"]) for i, p in enumerate(self.trick)]
+                logger.debug("Trick complete: %s", trick_log)
             
             winner = self._determine_trick_winner()
             
@@ -725,6 +725,7 @@ class BridgeGame:
             
             self.current_player = winner
             self.last_trick_winner = winner  # Store the trick winner for next lead
+            self.last_winning_card = winning_play["card"]
             
             # Create a deep copy of the trick before clearing it (for GUI reference)
             self.last_complete_trick = self.trick.copy()
@@ -753,12 +754,8 @@ class BridgeGame:
         # Get the suit of the first card in the trick
         led_suit = self.trick[0]["card"].suit
         
-        # Check if player has any cards of led suit
-        player_hand = self.players[player_idx]["hand"]
-        has_led_suit = any(c.suit == led_suit for c in player_hand)
-        
-        # If player has led suit, they must play it
-        if has_led_suit:
+        # If player has any cards of led suit, they must play it
+        if self.players[player_idx]["suit_counts"][led_suit]:
             return card.suit == led_suit
             
         # If player has no cards of led suit, they can play anything
@@ -788,32 +785,33 @@ class BridgeGame:
             winner = None
             
             # Create a string representation of the trick for debugging
-            trick_str = ", ".join([f"Player {p['player']}: {p['card']}" for p in self.trick])
-            logger.info(f"Trick to evaluate: {trick_str}")
-            logger.info(f"Led suit: {led_suit}")
+            if logger.isEnabledFor(logging.DEBUG):
+                trick_str = ", ".join([f"Player {p['player']}: {p['card']}" for p in self.trick])
+                logger.debug("Trick to evaluate: %s", trick_str)
+                logger.debug("Led suit: %s", led_suit)
             
             for i, play in enumerate(self.trick):
                 card = play["card"]
                 player = play["player"]
                 
                 # Log each card being evaluated
-                logger.info(f"Evaluating card {i+1}/4: {card} from player {player}")
+                logger.debug("Evaluating card %d/4: %s from player %s", i + 1, card, player)
                 
                 # Only cards of the led suit can win
                 if card.suit == led_suit:
-                    logger.info(f"Card is led suit ({led_suit})")
+                    logger.debug("Card is led suit (%s)", led_suit)
                     if highest_value == -1 or card.value > highest_value:
                         highest_value = card.value
                         winner = player
-                        logger.info(f"New highest card: {card} from player {player} (value={card.value})")
+                        logger.debug("New highest card: %s from player %s (value=%s)", card, player, card.value)
                 else:
-                    logger.info(f"Card is not led suit, cannot win: {card}")
+                    logger.debug("Card is not led suit, cannot win: %s", card)
             
             # Verify the winner card
             winning_card = self.trick[self.trick.index(next(p for p in self.trick if p["player"] == winner))]["card"]
             
             # Log the winner determination
-            logger.info(f"Winner: Player {winner} with highest {led_suit} card: {winning_card} (value={highest_value})")
+            logger.debug("Winner: Player %s with highest %s card: %s (value=%s)", winner, led_suit, winning_card, highest_value)
             return winner
         else:
             # With trumps - to be fully implemented later
@@ -866,7 +864,7 @@ class BridgeGame:
                 continue
                 
             # Count tricks for each partnership
-            if winner in [0, 2]:  # South and North (NS partnership)
+            if winner % 2 == 0:  # South and North (NS partnership)
                 ns_tricks += 1
             else:  # West and East (EW partnership)
                 ew_tricks += 1
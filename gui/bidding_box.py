@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk
 import time
 import logging
+from functools import partial
 from core.game import BridgeGame, Bid, BidType
 
 class BiddingBox(tk.Frame):
@@ -15,7 +16,20 @@ class BiddingBox(tk.Frame):
     # Card suits and denominations
     SUITS = {'C': '♣', 'D': '♦', 'H': '♥', 'S': '♠', 'NT': 'NT'}
     SUIT_COLORS = {'♣': 'black', '♦': 'red', '♥': 'red', '♠': 'black', 'NT': 'blue'}
-    POSITIONS = ['South', 'West', 'North', 'East']
+    POSITIONS = ('South', 'West', 'North', 'East')
+    
+    # Bidding history header lines
+    _HEADER = f"{'Player':<10} {'Bid':<10}\n"
+    _SEP = "-" * 20 + "\n"
+    
+    # Text tag used to color each suit symbol in the bidding history
+    _DENOM_TAG = {'♣': 'club', '♦': 'diamond', '♥': 'heart', '♠': 'spade'}
+    
+    # (letter, symbol) for each denomination, in grid column order
+    _DENOMS = (('C', '♣'), ('D', '♦'), ('H', '♥'), ('S', '♠'), ('NT', 'NT'))
+    
+    # Column of each denomination in the bid button grid
+    DENOM_INDEX = {'C': 0, 'D': 1, 'H': 2, 'S': 3, 'NT': 4}
     
     # Set up logger
     logger = logging.getLogger("BridgeGame.GUI.BiddingBox")
@@ -37,11 +51,33 @@ class BiddingBox(tk.Frame):
         self.on_bidding_complete = on_bidding_complete
         self.player_types = player_types  # Store player types directly in the bidding box
         
+        # Pending idle refresh flag (coalesces several bids into one redraw)
+        self._ui_refresh_pending = False
+        
+        # Bidder index currently shown in the bidder label
+        self._last_bidder_idx = None
+        
+        # Number of bids already rendered in the history display
+        self._rendered_bids = 0
+        
+        # Last get_valid_bids() result as ((history length, bidder), bids)
+        self._valid_bids_cache = None
+        
         # Create UI components
+        self._configure_styles()
         self._create_layout()
         
         self.logger.info("BiddingBox initialized")
     
+    def _configure_styles(self):
+        """Configure the shared ttk styles for the bid buttons, one per suit color."""
+        style = ttk.Style(self)
+        self._bid_button_styles = {}
+        for color in set(self.SUIT_COLORS.values()):
+            style_name = f"{color.capitalize()}Bid.TButton"
+            style.configure(style_name, font=('Arial', 12), width=4, foreground=color)
+            self._bid_button_styles[color] = style_name
+    
     def _create_layout(self):
         """Create the main layout for the bidding box."""
         # Main container with title
@@ -76,6 +112,10 @@ class BiddingBox(tk.Frame):
         # Create special bid buttons
         self._create_special_bid_buttons()
         
+        # Buttons currently enabled; every button starts out in the NORMAL state
+        self._prev_enabled = {button for bid_row in self.bid_buttons for button in bid_row}
+        self._prev_enabled.update((self.pass_button, self.double_button, self.redouble_button))
+        
         # History frame - now below the bidding frame
         history_frame = tk.Frame(content_frame, bg='#004400', bd=2, relief=tk.GROOVE)
         history_frame.pack(fill=tk.X, pady=(20, 0))  # Changed to fill X with top padding
@@ -84,20 +124,32 @@ class BiddingBox(tk.Frame):
         tk.Label(history_frame, text="Bidding History", 
                 font=('Arial', 14), bg='#004400', fg='white').pack(pady=10)
         
-        # Bidding history display - adjusted height for new layout
+        # Bidding history display - adjusted height for new layout.
+        # Lines are short fixed-width rows, so skip line wrapping entirely
         self.history_text = tk.Text(history_frame, height=10,  # Reduced height
-                                   font=('Courier', 12), bg='#002200', fg='white')
-        self.history_text.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+                                   font=('Courier', 12), bg='#002200', fg='white',
+                                   wrap=tk.NONE)
         
-        # Add scrollbar to history
-        scrollbar = tk.Scrollbar(self.history_text, command=self.history_text.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Add scrollbar to history, beside the Text rather than inside it
+        scrollbar = tk.Scrollbar(history_frame, command=self.history_text.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self.history_text.pack(side=tk.LEFT, padx=(10, 0), pady=10, fill=tk.BOTH, expand=True)
         self.history_text.config(yscrollcommand=scrollbar.set)
         
+        # Configure text tags for colors once; they persist for the widget's lifetime
+        self.history_text.tag_configure("p0", foreground="lightblue")
+        self.history_text.tag_configure("p1", foreground="lightgreen")
+        self.history_text.tag_configure("p2", foreground="lightblue")
+        self.history_text.tag_configure("p3", foreground="lightgreen")
+        
+        self.history_text.tag_configure("club", foreground="black")
+        self.history_text.tag_configure("diamond", foreground="red")
+        self.history_text.tag_configure("heart", foreground="red")
+        self.history_text.tag_configure("spade", foreground="black")
+        
         # Initialize history with header
         self.history_text.config(state=tk.NORMAL)
-        self.history_text.insert(tk.END, f"{'Player':<10} {'Bid':<10}\n")
-        self.history_text.insert(tk.END, "-" * 20 + "\n")
+        self.history_text.insert(tk.END, self._HEADER + self._SEP)
         self.history_text.config(state=tk.DISABLED)
     
     def _create_bidding_grid(self):
@@ -106,11 +158,11 @@ class BiddingBox(tk.Frame):
         grid_frame = tk.Frame(self.bid_frame, bg='darkgreen')
         grid_frame.pack(pady=10)
         
-        # Store bid buttons for later enabling/disabling
-        self.bid_buttons = {}
+        # Store bid buttons for later enabling/disabling, indexed [7 - level][DENOM_INDEX]
+        self.bid_buttons = [[None] * 5 for _ in range(7)]
         
         # Create column headers (denominations)
-        for col, denom in enumerate(['♣', '♦', '♥', '♠', 'NT']):
+        for col, (_, denom) in enumerate(self._DENOMS):
             label = tk.Label(grid_frame, text=denom, font=('Arial', 14, 'bold'),
                            fg=self.SUIT_COLORS[denom], bg='darkgreen')
             label.grid(row=0, column=col+1, padx=5, pady=5)
@@ -125,17 +177,15 @@ class BiddingBox(tk.Frame):
             level_label.grid(row=row+1, column=0, padx=10, pady=5)
             
             # Bid buttons for this level
-            for col, (letter_denom, symbol_denom) in enumerate(zip(['C', 'D', 'H', 'S', 'NT'], 
-                                                                 ['♣', '♦', '♥', '♠', 'NT'])):
+            for col, (letter_denom, symbol_denom) in enumerate(self._DENOMS):
                 bid_text = f"{level}{symbol_denom}"
-                button = tk.Button(grid_frame, text=bid_text, width=4, height=1,
-                                 font=('Arial', 12),
-                                 fg=self.SUIT_COLORS[symbol_denom],
-                                 command=lambda l=level, d=letter_denom: self._on_bid_click(l, d))
+                button = ttk.Button(grid_frame, text=bid_text,
+                                  style=self._bid_button_styles[self.SUIT_COLORS[symbol_denom]],
+                                  command=partial(self._on_bid_click, level, letter_denom))
                 button.grid(row=row+1, column=col+1, padx=3, pady=3)
                 
                 # Store the button for later enabling/disabling
-                self.bid_buttons[(level, letter_denom)] = button
+                self.bid_buttons[row][col] = button
     
     def _create_special_bid_buttons(self):
         """Create the Pass, Double, and Redouble buttons."""
@@ -145,19 +195,19 @@ class BiddingBox(tk.Frame):
         # Pass button
         self.pass_button = tk.Button(special_frame, text="Pass", width=10, height=2,
                                   font=('Arial', 12, 'bold'), bg='#CCFFCC', fg='green',
-                                  command=lambda: self._on_special_bid_click("Pass"))
+                                  command=partial(self._on_special_bid_click, "Pass"))
         self.pass_button.pack(side=tk.LEFT, padx=10)
         
         # Double button
         self.double_button = tk.Button(special_frame, text="Double", width=10, height=2,
                                     font=('Arial', 12, 'bold'), bg='#FFCCCC', fg='red',
-                                    command=lambda: self._on_special_bid_click("Double"))
+                                    command=partial(self._on_special_bid_click, "Double"))
         self.double_button.pack(side=tk.LEFT, padx=10)
         
         # Redouble button
         self.redouble_button = tk.Button(special_frame, text="Redouble", width=10, height=2,
                                       font=('Arial', 12, 'bold'), bg='#CCCCFF', fg='blue',
-                                      command=lambda: self._on_special_bid_click("Redouble"))
+                                      command=partial(self._on_special_bid_click, "Redouble"))
         self.redouble_button.pack(side=tk.LEFT, padx=10)
     
     def show(self):
@@ -167,11 +217,8 @@ class BiddingBox(tk.Frame):
         # Reset bidding history
         self.clear_history()
         
-        # Update current bidder display
-        self.update_current_bidder()
-        
-        # Update button states
-        self.update_button_states()
+        # Update bidder display and button states in the shared idle refresh
+        self._request_ui_refresh()
     
     def hide(self):
         """Hide the bidding box."""
@@ -181,70 +228,46 @@ class BiddingBox(tk.Frame):
         """Clear the bidding history display."""
         self.history_text.config(state=tk.NORMAL)
         self.history_text.delete(1.0, tk.END)
-        self.history_text.insert(tk.END, f"{'Player':<10} {'Bid':<10}\n")
-        self.history_text.insert(tk.END, "-" * 20 + "\n")
+        self.history_text.insert(tk.END, self._HEADER + self._SEP)
         self.history_text.config(state=tk.DISABLED)
+        self._rendered_bids = 0
+        self._valid_bids_cache = None
     
     def update_history(self):
-        """Update the bidding history display with the current bidding sequence."""
-        self.history_text.config(state=tk.NORMAL)
-        self.history_text.delete(1.0, tk.END)
+        """Append bids placed since the last update to the bidding history display."""
+        history = self.game.bidding_history
+        
+        # Start over if the history is shorter than what is on screen (new deal)
+        if len(history) < self._rendered_bids:
+            self.clear_history()
         
-        # Add header
-        self.history_text.insert(tk.END, f"{'Player':<10} {'Bid':<10}\n")
-        self.history_text.insert(tk.END, "-" * 20 + "\n")
+        # Build a flat text, tags, text, tags, ... list first so the widget is
+        # only left editable for a single multi-segment insert
+        segments = []
         
-        # Add each bid with color coding
-        for entry in self.game.bidding_history:
+        # Add each new bid with color coding
+        for entry in history[self._rendered_bids:]:
             player_idx = entry["player"]
-            player_name = self.POSITIONS[player_idx]
             bid_str = str(entry["bid"])
             
-            # Determine color based on player position
-            if player_idx in [0, 2]:  # North-South
-                text_color = "lightblue"
-            else:  # East-West
-                text_color = "lightgreen"
+            # Player name, colored by partnership through the p0-p3 tags
+            segments.extend((f"{self.POSITIONS[player_idx]:<10} ", (f"p{player_idx}",)))
             
-            # Insert player name
-            self.history_text.insert(tk.END, f"{player_name:<10} ", (f"p{player_idx}",))
-            
-            # Insert bid with appropriate color for suit symbols
-            if len(bid_str) >= 2 and bid_str[1] in "♣♦♥♠":
-                # Split the bid into level and denomination
-                level = bid_str[0]
-                denom = bid_str[1]
-                
-                # Insert level
-                self.history_text.insert(tk.END, level)
-                
-                # Insert denomination with appropriate color
-                if denom == "♣":
-                    self.history_text.insert(tk.END, denom, ("club",))
-                elif denom == "♦":
-                    self.history_text.insert(tk.END, denom, ("diamond",))
-                elif denom == "♥":
-                    self.history_text.insert(tk.END, denom, ("heart",))
-                elif denom == "♠":
-                    self.history_text.insert(tk.END, denom, ("spade",))
-                
-                # Add newline
-                self.history_text.insert(tk.END, "\n")
+            # Bid with appropriate color for suit symbols
+            tag = self._DENOM_TAG.get(bid_str[1]) if len(bid_str) >= 2 else None
+            if tag:
+                # Level, then denomination with its suit color
+                segments.extend((bid_str[0], (), bid_str[1], (tag,), "\n", ()))
             else:
                 # For Pass, Double, Redouble, or NT bids
-                self.history_text.insert(tk.END, f"{bid_str}\n")
+                segments.extend((f"{bid_str}\n", ()))
         
-        # Configure text tags for colors
-        self.history_text.tag_configure("p0", foreground="lightblue")
-        self.history_text.tag_configure("p1", foreground="lightgreen")
-        self.history_text.tag_configure("p2", foreground="lightblue")
-        self.history_text.tag_configure("p3", foreground="lightgreen")
-        
-        self.history_text.tag_configure("club", foreground="black")
-        self.history_text.tag_configure("diamond", foreground="red")
-        self.history_text.tag_configure("heart", foreground="red")
-        self.history_text.tag_configure("spade", foreground="black")
+        self._rendered_bids = len(history)
+        if not segments:
+            return
         
+        self.history_text.config(state=tk.NORMAL)
+        self.history_text.insert(tk.END, *segments)
         self.history_text.config(state=tk.DISABLED)
         
         # Scroll to the bottom
@@ -253,86 +276,100 @@ class BiddingBox(tk.Frame):
     def update_current_bidder(self):
         """Update the current bidder display."""
         current_bidder_idx = self.game.current_bidder
-        player_name = self.POSITIONS[current_bidder_idx]
+        if current_bidder_idx == self._last_bidder_idx:
+            return
+        self._last_bidder_idx = current_bidder_idx
         
-        self.current_bidder_label.config(text=player_name)
-        # All players are human, so always use yellow
-        self.current_bidder_label.config(fg='yellow')
+        # All players are human, so the label keeps the yellow set at creation
+        self.current_bidder_label.config(text=self.POSITIONS[current_bidder_idx])
     
     def update_button_states(self):
         """Enable/disable buttons based on valid bids."""
-        valid_bids = self.game.get_valid_bids()
-        current_player = self.game.current_bidder
-        
-        # First disable all buttons
-        for button in self.bid_buttons.values():
-            button.config(state=tk.DISABLED)
-        
-        self.pass_button.config(state=tk.DISABLED)
-        self.double_button.config(state=tk.DISABLED)
-        self.redouble_button.config(state=tk.DISABLED)
+        # Valid bids only change when a bid is placed, so reuse the last result
+        key = (len(self.game.bidding_history), self.game.current_bidder)
+        if self._valid_bids_cache is not None and self._valid_bids_cache[0] == key:
+            valid_bids = self._valid_bids_cache[1]
+        else:
+            valid_bids = self.game.get_valid_bids()
+            self._valid_bids_cache = (key, valid_bids)
         
-        # Enable valid bid buttons for current player (all players are human)
+        # Collect the buttons for the valid bids (all players are human)
+        new_enabled = set()
         for bid in valid_bids:
             if bid.bid_type == BidType.PASS:
-                self.pass_button.config(state=tk.NORMAL)
+                new_enabled.add(self.pass_button)
             elif bid.bid_type == BidType.DOUBLE:
-                self.double_button.config(state=tk.NORMAL)
+                new_enabled.add(self.double_button)
             elif bid.bid_type == BidType.REDOUBLE:
-                self.redouble_button.config(state=tk.NORMAL)
+                new_enabled.add(self.redouble_button)
             elif bid.bid_type == BidType.NORMAL:
-                button_key = (bid.level, bid.denomination)
-                if button_key in self.bid_buttons:
-                    self.bid_buttons[button_key].config(state=tk.NORMAL)
+                new_enabled.add(self.bid_buttons[7 - bid.level][self.DENOM_INDEX[bid.denomination]])
+        
+        # Only touch buttons whose state actually changes
+        for button in self._prev_enabled - new_enabled:
+            button.config(state=tk.DISABLED)
+        for button in new_enabled - self._prev_enabled:
+            button.config(state=tk.NORMAL)
+        
+        self._prev_enabled = new_enabled
+    
+    def _request_ui_refresh(self):
+        """Schedule a single refresh of history, bidder and buttons once Tk is idle."""
+        if not self._ui_refresh_pending:
+            self._ui_refresh_pending = True
+            self.after_idle(self._do_ui_refresh)
+    
+    def _do_ui_refresh(self):
+        """Run the deferred UI refresh requested by _request_ui_refresh."""
+        self._ui_refresh_pending = False
+        self.update_history()
+        self.update_current_bidder()
+        self.update_button_states()
     
     def _on_bid_click(self, level, denomination):
         """Handle a click on a normal bid button."""
         current_bidder = self.game.current_bidder
         
-        self.logger.info(f"Bid button clicked: {level}{denomination}")
+        self.logger.info("Bid button clicked: %s%s", level, denomination)
         
         # Create a bid and place it
         bid = Bid(BidType.NORMAL, level, denomination)
         success = self.game.place_bid(current_bidder, bid)
         
         if success:
-            self.logger.info(f"Bid placed: {bid}")
+            self.logger.info("Bid placed: %s", bid)
             
-            # Update UI
-            self.update_history()
-            self.update_current_bidder()
-            self.update_button_states()
+            # Update UI (deferred until Tk is idle)
+            self._request_ui_refresh()
             
             # Check if bidding is complete
             if self.game.current_state == "playing":
                 self.logger.info("Bidding complete")
                 self.on_bidding_complete()
         else:
-            self.logger.warning(f"Invalid bid: {bid}")
+            self.logger.warning("Invalid bid: %s", bid)
     
     def _on_special_bid_click(self, bid_type):
         """Handle a click on a special bid button (Pass, Double, Redouble)."""
         current_bidder = self.game.current_bidder
         
-        self.logger.info(f"Special bid button clicked: {bid_type}")
+        self.logger.info("Special bid button clicked: %s", bid_type)
         
         # Place the bid
         success = self.game.place_bid(current_bidder, bid_type)
         
         if success:
-            self.logger.info(f"Special bid placed: {bid_type}")
+            self.logger.info("Special bid placed: %s", bid_type)
             
-            # Update UI
-            self.update_history()
-            self.update_current_bidder()
-            self.update_button_states()
+            # Update UI (deferred until Tk is idle)
+            self._request_ui_refresh()
             
             # Check if bidding is complete
             if self.game.current_state == "playing":
                 self.logger.info("Bidding complete")
                 self.on_bidding_complete()
         else:
-            self.logger.warning(f"Invalid special bid: {bid_type}")
+            self.logger.warning("Invalid special bid: %s", bid_type)
     
     # AI bidding methods removed for human-only play
 
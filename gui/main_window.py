@@ -1,94 +1,148 @@
+import logging
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-import time
+from tkinter import font as tkfont
+from functools import wraps
 from core.game import BridgeGame
 from core.deck import Card
+from core.hand_evaluation import is_balanced
 from gui.bidding_box import BiddingBox
 from gui.player_setup import PlayerSetupDialog
 
+def _batched(method):
+    """Run a window method as one batch of UI changes, flushed by a single update_idletasks."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._batch_depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.update_idletasks()
+    return wrapper
+
 class CardView(tk.Label):
     SUITS = {'♠': 'black', '♥': 'red', '♦': 'red', '♣': 'black'}
     GUI_SUITS = {'S': '♠', 'H': '♥', 'D': '♦', 'C': '♣'}
     RANKS = {2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7', 8: '8', 9: '9', 10: '10',
              11: 'J', 12: 'Q', 13: 'K', 14: 'A'}
     
-    def __init__(self, parent, card=None, suit=None, rank=None, face_up=True, callback=None):
+    # Label options for each face-up card keyed by core (suit, value); filled in below the class
+    _FACE_OPTIONS = {}
+    
+    # Label options for a face-down card
+    _BACK_OPTIONS = {
+        'text': "🂠",  # Card back symbol
+        'fg': 'navy',
+        'bg': 'lightblue',
+        'width': 3,
+        'relief': tk.RAISED,
+        'padx': 2,
+        'pady': 2,
+        'borderwidth': 2
+    }
+    
+    # Bind tag carried by clickable card views, so a single class binding
+    # serves every card instead of one Tcl command per widget
+    CLICK_TAG = 'CardView'
+    _click_bound = False
+    
+    def __init__(self, parent, card=None, suit=None, rank=None, face_up=True, callback=None, *, font):
         self.card = card
         self.callback = callback
-        self.selected = False
-        
-        # If a Card object is provided, use its properties
-        if card:
-            suit = self.GUI_SUITS[card.suit]
-            rank = self.RANKS[card.value]
-        
-        # Calculate width based on rank
-        width = 4 if rank == '10' else 3
-        
-        if face_up:
-            super().__init__(
-                parent,
-                text=f"{rank}{suit}",
-                font=('Arial', 14),  # Increased font size
-                fg=self.SUITS[suit],
-                bg='white',
-                width=width,
-                relief=tk.RAISED,
-                padx=2,
-                pady=2,
-                borderwidth=2
-            )
+        self.enabled = False
+        
+        if not face_up:
+            options = self._BACK_OPTIONS
+        elif card:
+            # Precomputed at import, so no per-card lookups or formatting
+            options = self._FACE_OPTIONS[(card.suit, card.value)]
         else:
-            super().__init__(
-                parent,
-                text="🂠",  # Card back symbol
-                font=('Arial', 14),
-                fg='navy',
-                bg='lightblue',
-                width=3,
-                relief=tk.RAISED,
-                padx=2,
-                pady=2,
-                borderwidth=2
-            )
+            options = self._face_options(suit, rank)
+        
+        # Clickable cards get the hand cursor when hovering, set along with the other options
+        if callback and face_up:
+            super().__init__(parent, font=font, cursor="hand2", **options)
+        else:
+            super().__init__(parent, font=font, **options)
             
-        # Bind click event if callback is provided
+        # Route clicks through the shared class binding if callback is provided
         if callback and face_up:
-            self.bind("<Button-1>", self._on_click)
-            self.config(cursor="hand2")  # Change cursor to hand when hovering
+            if not CardView._click_bound:
+                self.bind_class(self.CLICK_TAG, "<Button-1>", CardView._on_click)
+                CardView._click_bound = True
+            self.bindtags((self.CLICK_TAG,) + self.bindtags())
+            self.enabled = True
     
-    def _on_click(self, event):
-        if self.callback:
-            self.callback(self)
+    @classmethod
+    def _face_options(cls, suit, rank):
+        """Build the label options for a face-up card from its display suit and rank"""
+        return {
+            'text': f"{rank}{suit}",
+            'fg': cls.SUITS[suit],
+            'bg': 'white',
+            'width': 4 if rank == '10' else 3,  # Calculate width based on rank
+            'relief': tk.RAISED,
+            'padx': 2,
+            'pady': 2,
+            'borderwidth': 2
+        }
+    
+    @staticmethod
+    def _on_click(event):
+        card_view = event.widget
+        if card_view.enabled:
+            card_view.callback(card_view)
     
-    def select(self):
-        """Highlight the card as selected"""
-        self.selected = True
-        self.config(bg='lightyellow', relief=tk.SUNKEN)
-        
-    def deselect(self):
-        """Remove the selection highlight"""
-        self.selected = False
-        self.config(bg='white', relief=tk.RAISED)
-        
-    def is_selected(self):
-        """Return whether the card is currently selected"""
-        return self.selected
-        
     def disable(self):
         """Disable the card from being clicked"""
-        self.unbind("<Button-1>")
-        self.config(cursor="")
-        self.config(bg='#f0f0f0')  # Light gray background
+        self.enabled = False
+        self.config(cursor="", bg='#f0f0f0')  # Light gray background
+    
+    def enable(self):
+        """Allow the card to be clicked again"""
+        self.enabled = True
+        self.config(cursor="hand2", bg='white')
+
+# Build the face-up options for all 52 cards once at import
+CardView._FACE_OPTIONS.update(
+    ((suit, value), CardView._face_options(CardView.GUI_SUITS[suit], CardView.RANKS[value]))
+    for suit in CardView.GUI_SUITS for value in CardView.RANKS
+)
 
 class BridgeGameWindow(tk.Tk):
     CARD_RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
     CARD_SUITS = ['♠', '♥', '♦', '♣']
-    POSITIONS = ['South', 'West', 'North', 'East']
+    POSITIONS = ('South', 'West', 'North', 'East')
+    
+    # Seat name labels, indexed by player
+    _SEAT_NAMES = ('South (You)', 'West', 'North', 'East')
+    
+    # How long a complete trick stays on the table before it is cleared (ms)
+    TRICK_DISPLAY_MS = 1000
+    
+    # Where each player's hand sits on the table, indexed by player
+    _HAND_POSITIONS = ('bottom', 'left', 'top', 'right')
+    
+    # (relx, rely, anchor) of each player's card in the trick area, indexed by player
+    _TRICK_PLACES = ((0.5, 1, 's'), (0, 0.5, 'w'), (0.5, 0, 'n'), (1, 0.5, 'e'))
+    
+    # (suit, symbol, symbol colour, frame background) of the suit frames in each hand
+    _SUIT_STYLES = (
+        ('S', '♠', 'white', '#000055'),  # Changed to white for better visibility
+        ('H', '♥', 'red', '#550000'),
+        ('D', '♦', 'red', '#550000'),
+        ('C', '♣', 'white', '#000055')
+    )
+    
+    # Status bar messages used while playing, built once rather than on every click
+    _FOLLOW_SUIT_MSG = {suit: f"Must follow suit ({suit})" for suit in 'SHDC'}
+    _TURN_MSG = tuple(f"It's {name}'s turn to play" for name in POSITIONS)
+    _MUST_LEAD_MSG = tuple(f"{name} must lead to the next trick (as trick winner)" for name in POSITIONS)
+    _NEXT_PLAYER_MSG = tuple(f"Next player: {name}" for name in POSITIONS)
     
-    # Import logging at class level
-    import logging
     logger = logging.getLogger("BridgeGame.GUI")
     
     # Add trick winner tracking
@@ -98,22 +152,39 @@ class BridgeGameWindow(tk.Tk):
     def __init__(self):
         super().__init__()
 
+        # Shared fonts, so Tk does not parse a font spec for every widget
+        self._fonts = {
+            # Cards and the center area labels share one Arial 14 font
+            'large': tkfont.Font(family='Arial', size=14),
+            'title': tkfont.Font(family='Arial', size=16, weight='bold'),
+            'seat': tkfont.Font(family='Arial', size=14, weight='bold'),
+            'status': tkfont.Font(family='Arial', size=12),
+            'hand_label': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'info_bold': tkfont.Font(family='Arial', size=10, weight='bold'),
+            'info': tkfont.Font(family='Arial', size=10),
+        }
+
         # Initialize game state
         self.game = BridgeGame()
         self.card_views = [[], [], [], []]  # Card views for each player
         self.player_types = {0: "human", 1: "ai", 2: "ai", 3: "ai"}  # Default player types
-        self.trick_card_views = [None, None, None, None]  # Cards in current trick
         self.trick_frames = [None, None, None, None]  # Frames for trick cards
         self.ns_tricks = 0
         self.ew_tricks = 0
-        self.current_player_highlight = None
+        self.current_player_highlight = None  # Player whose seat frame is highlighted
         self.waiting_for_trick_end = False
-        self.trick_count_verified = True  # Flag to track if trick count is verified
         self.trick_winner_cache = None  # Cache for trick winner to ensure consistency
-        self.last_trick_time = None  # Timestamp of last trick completion
-        self.clear_trick_job = None  # ID of scheduled _clear_trick job
         self.clear_trick_called = False  # Flag to track if _clear_trick was ever called
-        self.last_trick_displayed = False  # Flag to track if the last trick count was displayed
+        self._playable_player = None  # Player whose card views are currently clickable
+        self._batch_depth = 0  # Nesting depth of _batched methods
+        self._pending_status = None  # Latest status text waiting for the idle flush
+        self._flash_job = None  # ID of the scheduled end of a seat frame flash
+        self._flash_idx = None  # Index of the seat frame currently being flashed
+        self._card_pool = {}  # CardView per (suit, value), reused across deals
+        self._hand_widgets = [None, None, None, None]  # Per-hand labels and suit frames, built on the first deal
+        self._end_trick_job = None  # ID of the timer that ends the current trick
+        self._pending_ui = {}  # Queued UI updates by key, applied together by _flush_ui
+        self._ui_job = None  # ID of the scheduled _flush_ui job
 
         # Configure the main window
         self.title("Bridge Game")
@@ -137,14 +208,7 @@ class BridgeGameWindow(tk.Tk):
         self.logger.info(f"Screen dimensions: {screen_width}x{screen_height}")
         self.logger.info(f"Window dimensions: {window_width}x{window_height}")
         self.logger.info(f"Window position: +{x}+{y}")
-        
-        # Make sure window appears on top and gets focus
-        self.attributes('-topmost', True)  # Put window on top
-        self.update()  # Update to ensure topmost takes effect
-        self.attributes('-topmost', False)  # Disable topmost to allow other windows to go in front later
-        self.deiconify()  # Ensure window is not minimized
-        self.lift()      # Lift window to top of stacking order
-        self.focus_force()  # Force focus to this window
+
 
         self._create_menu()
         self._create_layout()
@@ -153,8 +217,9 @@ class BridgeGameWindow(tk.Tk):
         # Start a new game
         self._new_game()
         
-        # Final check to ensure window is visible
-        self.after(100, self._ensure_visibility)
+        # Raise the window and check it is visible once the startup work is
+        # drawn, rather than making the window manager round trips up front
+        self.after_idle(self._ensure_visibility)
 
     def _create_menu(self):
         menubar = tk.Menu(self)
@@ -175,22 +240,33 @@ class BridgeGameWindow(tk.Tk):
         self.main_frame.pack(expand=True, fill='both', padx=20, pady=20)
         
         # Create left and right container frames for split layout
-        self.left_container = tk.Frame(self.main_frame, bg='darkgreen', width=800)
-        self.right_container = tk.Frame(self.main_frame, bg='darkgreen', width=700)
-        
-        # Place left and right containers side by side
-        self.left_container.pack(side=tk.LEFT, fill='both', expand=True, padx=(0, 10))
-        self.right_container.pack(side=tk.RIGHT, fill='both', expand=True, padx=(10, 0))
-        
-        # Prevent containers from shrinking
-        self.left_container.pack_propagate(False)
+        self.left_container = tk.Frame(self.main_frame, bg='darkgreen', width=1000)
+        self.right_container = tk.Frame(self.main_frame, bg='darkgreen', width=500)
+        
+        # Place left and right containers side by side on the main frame's grid,
+        # splitting the width 2:1 like their requested widths; the bidding box
+        # needs far less room than the four hands around the table
+        self.main_frame.grid_rowconfigure(0, weight=1)
+        self.main_frame.grid_columnconfigure(0, weight=2, uniform='table')
+        self.main_frame.grid_columnconfigure(1, weight=1, uniform='table')
+        self.left_container.grid(row=0, column=0, sticky='nsew', padx=(0, 10))
+        self.right_container.grid(row=0, column=1, sticky='nsew', padx=(10, 0))
+        
+        # Prevent containers from resizing to their contents. The left container
+        # lays out the seats with grid, the right one packs the bidding box
+        self.left_container.grid_propagate(False)
         self.right_container.pack_propagate(False)
         
         # Create frames for each player with better styling (in left container)
-        self.north_frame = tk.Frame(self.left_container, bg='#004400', height=160, width=1200)  # Wide for horizontal cards
-        self.south_frame = tk.Frame(self.left_container, bg='#004400', height=160, width=1200)  # Wide for horizontal cards
-        self.east_frame = tk.Frame(self.left_container, bg='#004400', height=800, width=150)    # Tall and narrow for vertical cards
-        self.west_frame = tk.Frame(self.left_container, bg='#004400', height=800, width=150)    # Tall and narrow for vertical cards
+        # Sizes fit the left container at the default window size: North and
+        # South hold all 13 cards in one row, East and West one row per suit
+        self.north_frame = tk.Frame(self.left_container, bg='#004400', height=150, width=780)  # Wide for horizontal cards
+        self.south_frame = tk.Frame(self.left_container, bg='#004400', height=150, width=780)  # Wide for horizontal cards
+        self.east_frame = tk.Frame(self.left_container, bg='#004400', height=480, width=340)   # One row of cards per suit
+        self.west_frame = tk.Frame(self.left_container, bg='#004400', height=480, width=340)   # One row of cards per suit
+        
+        # Seat frames indexed by player number (0=South, 1=West, 2=North, 3=East)
+        self.player_frames = [self.south_frame, self.west_frame, self.north_frame, self.east_frame]
         
         # Create central playing area (in left container)
         self.center_frame = tk.Frame(self.left_container, bg='darkgreen', height=300, width=400)
@@ -201,42 +277,29 @@ class BridgeGameWindow(tk.Tk):
         self.trick_area = tk.Frame(self.center_frame, bg='darkgreen', height=300, width=300)
         self.trick_area.pack(pady=20)
         
-        # Create frames for each player's card in the trick
-        # North trick card
-        self.north_trick_frame = tk.Frame(self.trick_area, bg='darkgreen', height=70, width=70)
-        self.north_trick_frame.place(relx=0.5, rely=0, anchor='n')
-        
-        # South trick card
-        self.south_trick_frame = tk.Frame(self.trick_area, bg='darkgreen', height=70, width=70)
-        self.south_trick_frame.place(relx=0.5, rely=1, anchor='s')
-        
-        # East trick card
-        self.east_trick_frame = tk.Frame(self.trick_area, bg='darkgreen', height=70, width=70)
-        self.east_trick_frame.place(relx=1, rely=0.5, anchor='e')
-        
-        # West trick card
-        self.west_trick_frame = tk.Frame(self.trick_area, bg='darkgreen', height=70, width=70)
-        self.west_trick_frame.place(relx=0, rely=0.5, anchor='w')
-        
-        self.trick_frames = [
-            self.south_trick_frame,
-            self.west_trick_frame,
-            self.north_trick_frame, 
-            self.east_trick_frame
-        ]
-        
-        # Place frames using place geometry manager
-        # Position frames in a traditional bridge layout within the left container
-        self.north_frame.place(relx=0.5, rely=0.02, anchor='n')    # Moved up slightly
-        self.south_frame.place(relx=0.5, rely=0.98, anchor='s')    # Moved down slightly
-        self.east_frame.place(relx=0.98, rely=0.5, anchor='e')     # Moved more to the right
-        self.west_frame.place(relx=0.02, rely=0.5, anchor='w')     # Moved more to the left
-        self.center_frame.place(relx=0.5, rely=0.5, anchor='center')
-        # Add a title for the cards area in the left container
+        # Create a frame for each player's card in the trick, indexed by player
+        self.trick_frames = []
+        for relx, rely, anchor in self._TRICK_PLACES:
+            frame = tk.Frame(self.trick_area, bg='darkgreen', height=70, width=70)
+            frame.place(relx=relx, rely=rely, anchor=anchor)
+            self.trick_frames.append(frame)
+        
+        # One card label per trick slot, reconfigured for every card played
+        # and unpacked between tricks rather than destroyed
+        self.trick_slots = [tk.Label(frame, font=self._fonts['large']) for frame in self.trick_frames]
+        
+        # Add a title for the cards area in the left container, in a row of its own
         cards_title = tk.Label(self.left_container, text="Playing Cards", 
-                             font=('Arial', 16, 'bold'),
+                             font=self._fonts['title'],
                              bg='darkgreen', fg='white')
-        cards_title.place(relx=0.5, rely=0.02, anchor='n')
+        cards_title.grid(row=0, column=0, columnspan=3)
+        
+        # Position frames in a traditional bridge layout on a 3x3 grid below
+        # the title. Only the middle row and column stretch, so the center
+        # area takes up any shortfall and the seat frames keep their size
+        self.left_container.grid_rowconfigure(2, weight=1)
+        self.left_container.grid_columnconfigure(1, weight=1)
+        self._place_seat_frames()
 
         # Prevent frames from shrinking
         for frame in [self.north_frame, self.south_frame, self.east_frame, 
@@ -244,110 +307,112 @@ class BridgeGameWindow(tk.Tk):
             frame.pack_propagate(False)
 
         # Add labels for player positions with better styling
-        style = {'bg': '#004400', 'fg': 'white', 'font': ('Arial', 14, 'bold')}  # Increased font size
-        tk.Label(self.north_frame, text="North", **style).pack(pady=5)
-        tk.Label(self.south_frame, text="South (You)", **style).pack(pady=5)
-        tk.Label(self.east_frame, text="East", **style).pack(pady=5)
-        tk.Label(self.west_frame, text="West", **style).pack(pady=5)
+        ttk.Style(self).configure('Player.TLabel', background='#004400', foreground='white',
+                                  font=self._fonts['seat'])  # Increased font size
+        # Kept by player, so the first deal can replace them with the hands' own name labels
+        self._seat_labels = [ttk.Label(frame, text=seat_name, style='Player.TLabel')
+                             for frame, seat_name in zip(self.player_frames, self._SEAT_NAMES)]
+        for label in self._seat_labels:
+            label.pack(pady=5)
+        
+        # One cards frame per seat (indexed by player) for the lifetime of the
+        # window; each deal only replaces what is inside it
+        self.cards_frames = [tk.Frame(frame, bg='#004400') for frame in self.player_frames]
+        for frame in self.cards_frames:
+            frame.pack(pady=10, fill=tk.BOTH, expand=True)
         
         # Add trick counter and contract display in center
+        self._trick_text = "Tricks: NS: 0 | EW: 0"  # Text currently on the trick label
         self.trick_label = tk.Label(self.center_frame, 
-                                  text="Tricks: NS: 0 | EW: 0",
+                                  text=self._trick_text,
                                   bg='darkgreen', fg='white',
-                                  font=('Arial', 14))  # Increased font size
+                                  font=self._fonts['large'])  # Increased font size
         self.trick_label.pack(pady=10)
         
         self.contract_label = tk.Label(self.center_frame,
                                      text="Contract: Not set",
                                      bg='darkgreen', fg='white',
-                                     font=('Arial', 14))  # Increased font size
+                                     font=self._fonts['large'])  # Increased font size
         self.contract_label.pack(pady=10)
         
         # Add current player indicator
         self.current_player_label = tk.Label(self.center_frame,
                                            text="Current Player: South",
                                            bg='darkgreen', fg='yellow',
-                                           font=('Arial', 16, 'bold'))
+                                           font=self._fonts['title'])
         self.current_player_label.pack(pady=10)
 
+    def _place_seat_frames(self):
+        """Grid the four seat frames and the center area into the table layout."""
+        # North and South span all three columns, so their hands are not
+        # limited to the width of the center area
+        self.north_frame.grid(row=1, column=0, columnspan=3, sticky='nsew')
+        self.south_frame.grid(row=3, column=0, columnspan=3, sticky='nsew')
+        self.east_frame.grid(row=2, column=2, sticky='nsew')
+        self.west_frame.grid(row=2, column=0, sticky='nsew')
+        self.center_frame.grid(row=2, column=1, sticky='nsew')
+
     def _create_status_bar(self):
+        self._status_text = "Welcome to Bridge Game! Click 'Game > New Game' to start."
         self.status_bar = ttk.Label(
             self,
-            text="Welcome to Bridge Game! Click 'Game > New Game' to start.",
+            text=self._status_text,
             relief=tk.SUNKEN,
-            font=('Arial', 12)  # Added font size
+            font=self._fonts['status']  # Added font size
         )
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
-    def _display_hands(self):
-        """Display all player hands with face-up cards"""
-        # Clear existing cards
-        for i in range(4):
-            self.card_views[i] = []
-        
-        # Create frames for each player's cards
-        frames = []
-        
-        # South (player 0)
-        south_cards_frame = tk.Frame(self.south_frame, bg='#004400')
-        south_cards_frame.pack(pady=30)
-        frames.append((south_cards_frame, 'bottom'))
-        
-        # West (player 1)
-        west_cards_frame = tk.Frame(self.west_frame, bg='#004400')
-        west_cards_frame.pack(pady=30)
-        frames.append((west_cards_frame, 'left'))
-        
-        # North (player 2)
-        north_cards_frame = tk.Frame(self.north_frame, bg='#004400')
-        north_cards_frame.pack(pady=30)
-        frames.append((north_cards_frame, 'top'))
-        
-        # East (player 3)
-        east_cards_frame = tk.Frame(self.east_frame, bg='#004400')
-        east_cards_frame.pack(pady=30)
-        frames.append((east_cards_frame, 'right'))
-        
-        # Display cards for each player
-        for player_idx, (frame, position) in enumerate(frames):
-            # Get and sort cards
-            hand = sorted(self.game.players[player_idx]['hand'], 
-                          key=lambda c: (c.suit, -c.value))
-            
-            # Group cards by suit for better spacing
-            current_suit = None
-            for card in hand:
-                suit = card.suit
-                
-                if current_suit is not None and suit != current_suit:
-                    # Add a bit more space between suits
-                    spacer = tk.Label(frame, text=" ", bg='#004400', width=2)  # Increased spacer width
-                    if position in ['left', 'right']:
-                        spacer.pack(side=tk.TOP)  # Vertical spacing for East/West
-                    else:
-                        spacer.pack(side=tk.LEFT)  # Horizontal spacing for North/South
-                        
-                current_suit = suit
-                
-                # Create card view with callback for clickable cards - allow all positions to be played
-                card_view = CardView(frame, card=card, face_up=True, callback=self._on_card_click)
-                
-                # Store the player index in the card view for later reference
-                card_view.player_idx = player_idx
-                
-                if position in ['left', 'right']:  # East and West
-                    card_view.pack(side=tk.TOP, pady=4)  # Vertical stacking
-                else:  # North and South
-                    card_view.pack(side=tk.LEFT, padx=4)  # Horizontal arrangement
-                
-                # Store the card view for later reference
-                self.card_views[player_idx].append(card_view)
-        
-        # Highlight current player
-        self._highlight_current_player()
+    def _queue_ui(self, key, fn):
+        """Queue a UI update to run when Tk is idle.
+
+        Updates are kept by key, so queuing the same key again before the flush
+        only runs fn once; all queued updates are applied in a single idle callback.
+        """
+        self._pending_ui[key] = fn
+        if self._ui_job is None:
+            self._ui_job = self.after_idle(self._flush_ui)
+    
+    def _flush_ui(self):
+        """Apply the UI updates queued by _queue_ui."""
+        self._ui_job = None
+        pending, self._pending_ui = self._pending_ui, {}
+        for fn in pending.values():
+            fn()
+    
+    def _set_status(self, text):
+        """Set the status bar text; rapid updates collapse into one redraw when Tk is idle."""
+        self._pending_status = text
+        self._queue_ui('status', self._flush_status)
 
+    def _set_trick_label(self):
+        """Show the current trick counts once Tk is idle."""
+        self._queue_ui('trick_label', self._flush_trick_label)
+    
+    def _flush_trick_label(self):
+        """Apply the trick counts, skipping the configure if the text is unchanged."""
+        text = f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}"
+        if text != self._trick_text:
+            self.trick_label.config(text=text)
+            self._trick_text = text
+    
+    def _flush_status(self):
+        """Apply the latest status text queued by _set_status."""
+        # Skip the configure when the text is unchanged, e.g. the same wrong card clicked twice
+        if self._pending_status is not None and self._pending_status != self._status_text:
+            self.status_bar.config(text=self._pending_status)
+            self._status_text = self._pending_status
+        self._pending_status = None
+
+    @_batched
     def _new_game(self):
         """Start a new game"""
+        # Stop the last game's timers first: Tk keeps running them while the
+        # setup dialog waits, and the trick end could open the game over box
+        self._cancel_flash()  # Don't let a flash from the last game fire into this one
+        if self._end_trick_job is not None:
+            self.after_cancel(self._end_trick_job)
+            self._end_trick_job = None
+        
         # Show player setup dialog
         setup_dialog = PlayerSetupDialog(self)
         self.wait_window(setup_dialog)
@@ -363,71 +428,28 @@ class BridgeGameWindow(tk.Tk):
         self.game.new_game()  # This deals the cards
         
         # Clear trick area
-        for frame in self.trick_frames:
-            for widget in frame.winfo_children():
-                widget.destroy()
-        
-        # Clear player frames
-        for frame in [self.north_frame, self.south_frame, self.east_frame, self.west_frame]:
-            for widget in frame.winfo_children():
-                if isinstance(widget, tk.Frame):
-                    widget.destroy()
+        self._hide_trick_cards()
         
         # Reset game state
-        self.trick_card_views = [None, None, None, None]
         self.ns_tricks = 0
         self.ew_tricks = 0
-        self.trick_count_verified = True  # Reset verification flag
+        self.trick_winner = None  # No trick won yet
         self.trick_winner_cache = None  # Reset winner cache
-        self.last_trick_time = None  # Reset trick timing
-        self.clear_trick_job = None  # Reset scheduled job ID
+        self.waiting_for_trick_end = False  # Don't carry a half-finished trick into this game
         self.clear_trick_called = False  # Reset clear_trick called flag
-        self.last_trick_displayed = False  # Reset display flag
-        
-        # Clear any stored trick values
-        if hasattr(self, '_stored_ns_tricks'):
-            delattr(self, '_stored_ns_tricks')
-        if hasattr(self, '_stored_ew_tricks'):
-            delattr(self, '_stored_ew_tricks')
-        if hasattr(self, '_stored_trick_winner'):
-            delattr(self, '_stored_trick_winner')
             
-        self.trick_label.config(text="Tricks: NS: 0 | EW: 0")
-        self.trick_label.update()  # Force update immediately
-        self.update_idletasks()  # Additional update for good measure
+        self._set_trick_label()
         self.logger.info("Game state reset - trick counts zeroed")
         
-        # Show all player frames for bidding
-        self.north_frame.place(relx=0.5, rely=0.02, anchor='n')
-        self.south_frame.place(relx=0.5, rely=0.98, anchor='s')
-        self.east_frame.place(relx=0.98, rely=0.5, anchor='e')
-        self.west_frame.place(relx=0.02, rely=0.5, anchor='w')
-        self.center_frame.place(relx=0.5, rely=0.5, anchor='center')
-        
         # Reset game state to ensure bidding
         self.game.current_state = "bidding"
         
         # Log game state before starting bidding
         self.logger.info("Starting bidding phase")
-        self.logger.info(f"Game state: {self.game.current_state}, Bidder: {self.game.current_bidder}")
-        
-        # Check if cards were dealt properly
-        total_cards = sum(len(player["hand"]) for player in self.game.players)
-        self.logger.info(f"Total cards before bidding: {total_cards}")
-        
-        if total_cards != 52:
-            self.logger.warning(f"Card count mismatch! Expected 52, got {total_cards}. Re-dealing cards.")
-            self.game.deal_cards()
-        
-        # Verify each player has 13 cards
-        for i, player in enumerate(self.game.players):
-            cards_count = len(player["hand"])
-            self.logger.info(f"Player {i} has {cards_count} cards")
-            if cards_count != 13:
-                self.logger.error(f"Player {i} has {cards_count} cards instead of 13!")
+        self.logger.info("Game state: %s, Bidder: %s", self.game.current_state, self.game.current_bidder)
         
         # Always prepare for bidding phase
-        self.status_bar.config(text="New game started - Bidding phase")
+        self._set_status("New game started - Bidding phase")
         
         # Start bidding phase
         self._prepare_for_bidding()
@@ -440,185 +462,152 @@ class BridgeGameWindow(tk.Tk):
         # Get the card object and player index
         card = card_view.card
         player_idx = card_view.player_idx
+        position = self.POSITIONS[player_idx]
+        game = self.game
         
         # Log attempt
-        self.logger.info(f"Card click: {self.POSITIONS[player_idx]} attempting to play {card}")
+        self.logger.info("Card click: %s attempting to play %s", position, card)
         
         # Check if it's this player's turn
-        if player_idx != self.game.current_player:
-            self.status_bar.config(text=f"It's {self.POSITIONS[self.game.current_player]}'s turn to play")
-            self.logger.info(f"Wrong player: {self.POSITIONS[player_idx]} tried to play but it's {self.POSITIONS[self.game.current_player]}'s turn")
+        if player_idx != game.current_player:
+            self._set_status(self._TURN_MSG[game.current_player])
+            self.logger.info("Wrong player: %s tried to play but it's %s's turn", position, self.POSITIONS[game.current_player])
             return
             
         # Check if this is a new trick and enforce proper lead
-        if not self.game.trick and self.game.last_trick_winner is not None:
+        if not game.trick and game.last_trick_winner is not None:
             # If it's a new trick and not the first trick of the hand, only the winner can lead
-            if player_idx != self.game.last_trick_winner:
+            if player_idx != game.last_trick_winner:
                 # Wrong player trying to lead
-                self.logger.info(f"Wrong player leading: {self.POSITIONS[player_idx]} tried to lead but it's {self.POSITIONS[self.game.last_trick_winner]}'s turn")
-                self.status_bar.config(text=f"{self.POSITIONS[self.game.last_trick_winner]} must lead to the next trick (as trick winner)")
+                self.logger.info("Wrong player leading: %s tried to lead but it's %s's turn", position, self.POSITIONS[game.last_trick_winner])
+                self._set_status(self._MUST_LEAD_MSG[game.last_trick_winner])
                 return
             else:
-                self.logger.info(f"Correct player leading: {self.POSITIONS[player_idx]} (trick winner)")
+                self.logger.info("Correct player leading: %s (trick winner)", position)
         
         # Check if player is following suit if required
-        if self.game.trick:
-            led_suit = self.game.trick[0]["card"].suit
-            player_hand = self.game.players[player_idx]["hand"]
-            has_led_suit = any(c.suit == led_suit for c in player_hand)
+        if game.trick:
+            led_suit = game.trick[0]["card"].suit
+            has_led_suit = game.players[player_idx]["suit_counts"][led_suit] > 0
             
             if has_led_suit and card.suit != led_suit:
-                self.status_bar.config(text=f"Must follow suit ({led_suit})")
-                self.logger.info(f"{self.POSITIONS[player_idx]} must follow {led_suit} suit")
+                self._set_status(self._FOLLOW_SUIT_MSG[led_suit])
+                self.logger.info("%s must follow %s suit", position, led_suit)
                 return
         
         # Try to play the card
-        if self.game.play_card(player_idx, card):
-            # Card played successfully
-            self.logger.info(f"Card played successfully: {self.POSITIONS[player_idx]} played {card}")
-            self._show_played_card(player_idx, card)
+        if game.play_card(player_idx, card):
+            self._on_card_played(player_idx, card)
+        else:
+            # Card play failed
+            self.logger.warning(f"Invalid play: {position} attempted to play {card}")
+            self._set_status("Invalid play. Please try another card.")
+    
+    def _on_card_played(self, player_idx, card):
+        """Bring the table up to date after a successful play.
+
+        Not batched: the changes are left for Tk to draw when it next goes
+        idle, together with the status and highlight updates queued by
+        _queue_ui. A completed trick stays on the table until the
+        TRICK_DISPLAY_MS timer runs _end_trick.
+        """
+        # Card played successfully
+        self.logger.info("Card played successfully: %s played %s", self.POSITIONS[player_idx], card)
+        self._show_played_card(player_idx, card)
+        
+        # Hide the played card; the rest of the hand stays as it is
+        self._refresh_player_hand(player_idx, card)
+        
+        # Check if trick is complete (the core clears the trick after the fourth card)
+        if not self.game.trick:
+            self.logger.debug("Trick complete with 4 cards - Current trick counts: NS: %s, EW: %s", self.ns_tricks, self.ew_tricks)
+            self.waiting_for_trick_end = True
             
-            # Remove card from display and refresh the player's hand
-            self._refresh_player_hand(player_idx)
+            # Snapshot of trick and display state before processing
+            if self.logger.isEnabledFor(logging.DEBUG):
+                current_trick_content = [(play["player"], str(play["card"])) for play in self.game.last_complete_trick]
+                self.logger.debug("TRICK COMPLETE SNAPSHOT: %s, NS: %s, EW: %s", current_trick_content, self.ns_tricks, self.ew_tricks)
             
-            # Check if trick is complete
-            if len(self.game.trick) == 4:
-                self.logger.info(f"Trick complete with 4 cards - Current trick counts: NS: {self.ns_tricks}, EW: {self.ew_tricks}, Verified: {self.trick_count_verified}")
-                self.waiting_for_trick_end = True
-                self.last_trick_displayed = False  # Reset flag for new trick processing
-                
-                # Snapshot of trick and display state before processing
-                current_trick_content = [(play["player"], str(play["card"])) for play in self.game.trick]
-                self.logger.info(f"TRICK COMPLETE SNAPSHOT: {current_trick_content}, NS: {self.ns_tricks}, EW: {self.ew_tricks}")
-                
-                # Process trick immediately for better reliability
-                try:
-                    self._end_trick()
-                except Exception as e:
-                    self.logger.error(f"ERROR in _end_trick: {e}")
-                    # Force trick count update if _end_trick fails
-                    self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-                    self.trick_label.update()
-            else:
-                # Update to next player in sequence
-                next_player = (player_idx + 1) % 4
-                self.game.current_player = next_player
-                self.logger.info(f"Setting next player to: {next_player} ({self.POSITIONS[next_player]})")
-                self._highlight_current_player()
-                self.logger.info(f"Next player: {self.POSITIONS[self.game.current_player]}")
-                self.status_bar.config(text=f"Next player: {self.POSITIONS[self.game.current_player]}")
+            # Highlight the winning card while the full trick is on the table
+            self.trick_slots[self.game.last_trick_winner].config(bg='lightgreen')
+            
+            # Leave the complete trick on show for a moment before clearing it;
+            # waiting_for_trick_end blocks clicks meanwhile
+            if self._end_trick_job is None:
+                self._end_trick_job = self.after(self.TRICK_DISPLAY_MS, self._run_end_trick)
         else:
-            # Card play failed
-            self.logger.warning(f"Invalid play: {self.POSITIONS[player_idx]} attempted to play {card}")
-            self.status_bar.config(text=f"Invalid play. Please try another card.")
+            # Update to next player in sequence
+            next_player = (player_idx + 1) % 4
+            self.game.current_player = next_player
+            self.logger.info("Setting next player to: %s (%s)", next_player, self.POSITIONS[next_player])
+            self._highlight_current_player()
+            self._set_status(self._NEXT_PLAYER_MSG[next_player])
+    
+    def _run_end_trick(self):
+        """Run the trick end scheduled by _on_card_played"""
+        self._end_trick_job = None
+        try:
+            self._end_trick()
+        except Exception as e:
+            self.logger.error(f"ERROR in _end_trick: {e}")
+            # Force trick count update if _end_trick fails
+            self._set_trick_label()
+            # Don't leave card clicks blocked for the rest of the hand
+            self.waiting_for_trick_end = False
     
     def _show_played_card(self, player_idx, card):
         """Display a card in the trick area"""
-        # Create a frame for the card if not exists
-        frame = self.trick_frames[player_idx]
-        
-        # Clear any existing card
-        for widget in frame.winfo_children():
-            widget.destroy()
-        
-        # Create and display the card
-        card_view = CardView(frame, card=card, face_up=True)
+        # Show the card in the player's persistent trick slot
+        card_view = self.trick_slots[player_idx]
+        card_view.config(**CardView._FACE_OPTIONS[(card.suit, card.value)])
         card_view.pack(padx=5, pady=5)
         
-        # Store reference to the card view
-        self.trick_card_views[player_idx] = card_view
-        
         # Update status
-        self.status_bar.config(text=f"{self.POSITIONS[player_idx]} played {card}")
+        self._set_status(f"{self.POSITIONS[player_idx]} played {card}")
+    
+    def _hide_trick_cards(self):
+        """Take the played cards out of the trick area"""
+        for card_view in self.trick_slots:
+            card_view.pack_forget()
     
+    @_batched
     def _end_trick(self):
         """Handle end of trick"""
-        import time
-        current_time = time.time()
-        
         # Log entering _end_trick with detailed state
-        self.logger.info(f"ENTERING _end_trick - Window state: Exists: {self.winfo_exists()}, Viewable: {self.winfo_viewable()}")
-        self.logger.info(f"Trick counts: NS: {self.ns_tricks}, EW: {self.ew_tricks}, clear_trick_called: {self.clear_trick_called}")
-        
-        # Prevent double-processing of tricks (debounce)
-        if self.last_trick_time and (current_time - self.last_trick_time < 2.0):
-            self.logger.warning(f"TRICK END - Ignoring duplicate call to _end_trick (last call was {current_time - self.last_trick_time:.2f}s ago)")
-            # Even if we skip this call, ensure trick counts are displayed correctly
-            self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-            self.trick_label.update()  # Force immediate update
-            return
-            
-        # Cancel any existing scheduled clear_trick job
-        if self.clear_trick_job:
-            self.logger.info(f"Cancelling previous clear_trick job: {self.clear_trick_job}")
-            self.after_cancel(self.clear_trick_job)
-            self.clear_trick_job = None
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("ENTERING _end_trick - Window state: Exists: %s, Viewable: %s", self.winfo_exists(), self.winfo_viewable())
+        self.logger.debug("Trick counts: NS: %s, EW: %s, clear_trick_called: %s", self.ns_tricks, self.ew_tricks, self.clear_trick_called)
         
-        self.last_trick_time = current_time
-        self.logger.info(f"TRICK END - Beginning trick count processing. Current counts: NS: {self.ns_tricks}, EW: {self.ew_tricks}")
+        self.logger.debug("TRICK END - Beginning trick count processing. Current counts: NS: %s, EW: %s", self.ns_tricks, self.ew_tricks)
         
-        # First, capture the complete trick before it's cleared
-        complete_trick = self.game.trick.copy()
+        # The core has already scored the trick: take the trick, winner and winning card from it
+        complete_trick = self.game.last_complete_trick
         if not complete_trick or len(complete_trick) != 4:
-            self.logger.error(f"TRICK END - Invalid trick: Expected 4 cards but found {len(complete_trick)}")
+            self.logger.error(f"TRICK END - Invalid trick: Expected 4 cards but found {len(complete_trick) if complete_trick else 0}")
+            self.waiting_for_trick_end = False  # Don't leave card clicks blocked
             return
             
         # Record the raw trick data for debugging
-        raw_trick_data = [(i, play["player"], str(play["card"])) for i, play in enumerate(complete_trick)]
-        self.logger.info(f"Raw trick data: {raw_trick_data}")
-        
-        # Determine winner using game's method
-        winner_idx = self.game._determine_trick_winner()
-        
-        # Log detailed information about trick completion
-        trick_cards = [(i, play["player"], play["card"]) for i, play in enumerate(complete_trick)]
-        self.logger.info(f"Evaluating trick winner for trick: {trick_cards}")
-        
-        # Double-check the winner determination with our own calculation
-        # This is a safeguard against any bugs in the game's winner determination
-        led_suit = complete_trick[0]["card"].suit
-        highest_value = -1
-        calculated_winner = None
-        
-        # Detailed verification of winner
-        self.logger.info(f"Led suit: {led_suit}")
-        
-        for play in complete_trick:
-            card = play["card"]
-            player = play["player"]
-            self.logger.info(f"Evaluating card: {card} from player {player} (suit: {card.suit}, value: {card.value})")
-            
-            if card.suit == led_suit:
-                self.logger.info(f"Card follows led suit {led_suit}")
-                if highest_value == -1 or card.value > highest_value:
-                    highest_value = card.value
-                    calculated_winner = player
-                    self.logger.info(f"New highest card: {card} (value: {card.value}) from player {player}")
-            else:
-                self.logger.info(f"Card does not follow led suit, cannot win trick")
-                
-        if calculated_winner is None:
-            self.logger.error(f"CRITICAL ERROR: Failed to determine calculated winner")
-            # Fallback to first player as a last resort
-            calculated_winner = complete_trick[0]["player"]
-                
-        if calculated_winner != winner_idx:
-            self.logger.warning(f"Winner discrepancy! Game returned {winner_idx} but calculation gives {calculated_winner}")
-            # Use the calculated winner as a fallback since our calculation is simpler and more reliable
-            winner_idx = calculated_winner
+        if self.logger.isEnabledFor(logging.DEBUG):
+            raw_trick_data = [(i, play["player"], str(play["card"])) for i, play in enumerate(complete_trick)]
+            self.logger.debug("Raw trick data: %s", raw_trick_data)
+        
+        winner_idx = self.game.last_trick_winner
+        winner_name = self.POSITIONS[winner_idx]
+        winning_card = self.game.last_winning_card
+        if __debug__:
+            # The winning card must be the winner's own play in this trick
+            assert any(play["player"] == winner_idx and play["card"] == winning_card
+                       for play in complete_trick), (winner_idx, winning_card)
         
         # Store the winner for the next trick - this is critical for proper lead tracking
         self.trick_winner = winner_idx
         self.trick_winner_cache = winner_idx  # Cache winner for future reference
-        self.logger.info(f"FINAL trick winner determined: {self.POSITIONS[winner_idx]} (player {winner_idx})")
-        self.trick_count_verified = False  # Set flag to indicate trick count needs verification
+        self.logger.debug("FINAL trick winner determined: %s (player %s)", winner_name, winner_idx)
         
-        # Find the winning card from the captured trick
-        winning_play = next(p for p in complete_trick if p["player"] == winner_idx)
-        winning_card = winning_play["card"]
         led_suit = complete_trick[0]["card"].suit
         
-        self.logger.info(f"Winning card: {winning_card} from player {winner_idx}")
+        self.logger.debug("Winning card: %s from player %s", winning_card, winner_idx)
         
         # Prepare reason text with detailed explanation
         if winning_card.suit == led_suit:
@@ -630,109 +619,42 @@ class BridgeGameWindow(tk.Tk):
             reason = f"Trump card ({winning_card.suit})"
             winning_explanation = f"Won by trumping with {winning_card.suit}"
             
-        self.logger.info(f"Win reason: {winning_explanation}")
-        
-        # Update trick count - critical section that must work correctly
-        self.logger.info(f"BEFORE TRICK COUNT UPDATE - NS: {self.ns_tricks}, EW: {self.ew_tricks}, Winner: {self.POSITIONS[winner_idx]} (index: {winner_idx})")
+        self.logger.debug("Win reason: %s", winning_explanation)
         
-        # Capture old counts before update for verification
-        old_ns = self.ns_tricks
-        old_ew = self.ew_tricks
+        # Update trick count
+        self.logger.debug("BEFORE TRICK COUNT UPDATE - NS: %s, EW: %s, Winner: %s (index: %s)", self.ns_tricks, self.ew_tricks, winner_name, winner_idx)
         
         # Save the winner information first - critical for next trick leadership
         self.game.last_trick_winner = winner_idx
         
-        # Atomic trick count update with explicit locking
-        try:
-            # In a real concurrent environment, we'd use a lock here
-            # For this single-threaded app, we just ensure we don't get interrupted
-            
-            if winner_idx in [0, 2]:  # South and North (NS partnership)
-                # Increment NS trick count
-                self.ns_tricks += 1
-                self.logger.info(f"North-South won trick, NS TRICKS INCREMENTED from {old_ns} to {self.ns_tricks}")
-            else:  # West and East (EW partnership)
-                # Increment EW trick count  
-                self.ew_tricks += 1
-                self.logger.info(f"East-West won trick, EW TRICKS INCREMENTED from {old_ew} to {self.ew_tricks}")
-                
-            # Verify and correct the trick counts if needed
-            if winner_idx in [0, 2] and self.ns_tricks != old_ns + 1:
-                self.logger.error(f"NS TRICK COUNT ERROR: Should be {old_ns + 1} but is {self.ns_tricks}")
-                self.ns_tricks = old_ns + 1  # Force the correct value
-            elif winner_idx in [1, 3] and self.ew_tricks != old_ew + 1:
-                self.logger.error(f"EW TRICK COUNT ERROR: Should be {old_ew + 1} but is {self.ew_tricks}")
-                self.ew_tricks = old_ew + 1  # Force the correct value
-                
-            # Double-check trick counts
-            correct_ns = old_ns + (1 if winner_idx in [0, 2] else 0)
-            correct_ew = old_ew + (1 if winner_idx in [1, 3] else 0)
-            
-            if self.ns_tricks != correct_ns or self.ew_tricks != correct_ew:
-                self.logger.error(f"CRITICAL TRICK COUNT MISMATCH: NS should be {correct_ns}, is {self.ns_tricks}; EW should be {correct_ew}, is {self.ew_tricks}")
-                # Force correct values
-                self.ns_tricks = correct_ns
-                self.ew_tricks = correct_ew
-            
-            # Update the trick count display immediately - THIS IS CRITICAL
-            # Do this BEFORE calling _clear_trick to ensure counts are displayed
-            self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-            self.logger.info(f"TRICK COUNT UPDATED - NS: {self.ns_tricks}, EW: {self.ew_tricks}")
-            # Force update of the display - CRITICAL for user feedback
-            self.trick_label.update()  # Use update() instead of update_idletasks() for more immediate refresh
-            self.update_idletasks()    # Also call this for good measure
-            
-            self.logger.info(f"AFTER TRICK COUNT UPDATE - NS: {self.ns_tricks}, EW: {self.ew_tricks} - DISPLAY UPDATED")
-            self.trick_count_verified = True  # Mark trick count as verified
-            
-        except Exception as e:
-            self.logger.error(f"ERROR in trick completion: {e}")
-            # Emergency recovery - force correct values
-            if winner_idx in [0, 2]:
-                self.ns_tricks = old_ns + 1
-            else:
-                self.ew_tricks = old_ew + 1
-            # Update display in emergency mode
-            self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-            self.trick_label.update()  # More forceful update
-            self.update_idletasks()    # Additional update to ensure display refresh
-            self.logger.info(f"EMERGENCY TRICK COUNT RECOVERY - NS: {self.ns_tricks}, EW: {self.ew_tricks}")
-            self.trick_count_verified = True  # Mark trick count as verified in emergency mode
-            
-        # Call _clear_trick outside try-except to ensure it always runs
-        # This is critical for proper trick progression
-        self.logger.info(f"CALLING _clear_trick directly after try-except at {time.time()}")
+        if winner_idx % 2 == 0:  # South and North (NS partnership)
+            self.ns_tricks += 1
+        else:  # West and East (EW partnership)
+            self.ew_tricks += 1
+        self.logger.debug("AFTER TRICK COUNT UPDATE - NS: %s, EW: %s", self.ns_tricks, self.ew_tricks)
+        
+        # The trick count display is refreshed once, at the end of _clear_trick
+        self.logger.debug("CALLING _clear_trick")
         self._clear_trick()
-        self.logger.info("_clear_trick completed successfully")
+        self.logger.debug("_clear_trick completed successfully")
         
-        status_text = f"Trick won by {self.POSITIONS[winner_idx]} with {winning_card}! ({reason})"
+        status_text = f"Trick won by {winner_name} with {winning_card}! ({reason})"
         self.logger.info(status_text)
-        self.status_bar.config(text=status_text)
-        
-        # Highlight winning card
-        if self.trick_card_views[winner_idx]:
-            self.trick_card_views[winner_idx].config(bg='lightgreen')
+        self._set_status(status_text)
         
         # Log window state
-        self.logger.info(f"TRICK COUNTS UPDATED - Window exists: {self.winfo_exists()}, Viewable: {self.winfo_viewable()}, Mapped: {self.winfo_ismapped()}")
-        
-        # CRITICAL: Store the current trick counts for verification during cleanup
-        # This ensures we have the correct counts regardless of when _clear_trick runs
-        self._stored_ns_tricks = self.ns_tricks
-        self._stored_ew_tricks = self.ew_tricks
-        self._stored_trick_winner = winner_idx
-        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("TRICK COUNTS UPDATED - Window exists: %s, Viewable: %s, Mapped: %s", self.winfo_exists(), self.winfo_viewable(), self.winfo_ismapped())
     
     # Emergency trick processing method is no longer needed since we call _clear_trick directly
     # in the _end_trick method. This ensures more reliable trick processing.
     
     def _reset_trick_state(self):
         """Reset the trick state without doing full _clear_trick"""
-        self.logger.info(f"RESETTING TRICK STATE - Current counts: NS: {self.ns_tricks}, EW: {self.ew_tricks}")
+        self.logger.info("RESETTING TRICK STATE - Current counts: NS: %s, EW: %s", self.ns_tricks, self.ew_tricks)
         
-        # Force trick count display update
-        self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-        self.trick_label.update_idletasks()
+        # Refresh the trick count display
+        self._set_trick_label()
         
         # Reset waiting state
         self.waiting_for_trick_end = False
@@ -743,135 +665,31 @@ class BridgeGameWindow(tk.Tk):
             self.game.current_player = winner
             self.game.last_trick_winner = winner
             self._highlight_current_player()
-            self.logger.info(f"Reset next player to {self.POSITIONS[winner]}")
+            self.logger.info("Reset next player to %s", self.POSITIONS[winner])
         
         self.logger.info("Trick state reset complete")
     
 
+    @_batched
     def _clear_trick(self):
         """Clear the current trick display"""
-        import traceback
         self.clear_trick_called = True  # Mark that _clear_trick was called
-        self.logger.info(f"ENTERING _clear_trick - Current trick counts: NS: {self.ns_tricks}, EW: {self.ew_tricks}, Verified: {self.trick_count_verified}")
-        self.logger.info(f"Window state: Exists: {self.winfo_exists()}, Viewable: {self.winfo_viewable()}, Mapped: {self.winfo_ismapped()}")
-        
-        # CRITICAL: Verify trick counts against stored values before clearing
-        # This ensures counts haven't been lost between _end_trick and now
-        if hasattr(self, '_stored_ns_tricks') and hasattr(self, '_stored_ew_tricks'):
-            if self.ns_tricks != self._stored_ns_tricks or self.ew_tricks != self._stored_ew_tricks:
-                self.logger.error(f"TRICK COUNT LOST: Current NS: {self.ns_tricks}, stored: {self._stored_ns_tricks}, " +
-                                 f"Current EW: {self.ew_tricks}, stored: {self._stored_ew_tricks}")
-                # Restore from stored values to ensure counts aren't lost
-                self.ns_tricks = self._stored_ns_tricks
-                self.ew_tricks = self._stored_ew_tricks
-                self.logger.info(f"RESTORED trick counts from stored values: NS: {self.ns_tricks}, EW: {self.ew_tricks}")
-                
-        # Update display immediately
-        try:
-            self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-            self.trick_label.update()  # Force immediate update, not just idle tasks
-            self.logger.info(f"Updated trick display: NS: {self.ns_tricks}, EW: {self.ew_tricks}")
-        except Exception as e:
-            self.logger.error(f"Failed to update trick display: {str(e)}")
-        
-        # CRITICAL: Check stored values first - this ensures trick counts don't get lost
-        if hasattr(self, '_stored_ns_tricks') and hasattr(self, '_stored_ew_tricks') and hasattr(self, '_stored_trick_winner'):
-            if self.ns_tricks != self._stored_ns_tricks or self.ew_tricks != self._stored_ew_tricks:
-                self.logger.warning(f"TRICK COUNT MISMATCH: Current NS: {self.ns_tricks}, stored: {self._stored_ns_tricks}, " +
-                                   f"Current EW: {self.ew_tricks}, stored: {self._stored_ew_tricks}")
-                # Use stored values as they were set at trick end time
-                self.ns_tricks = self._stored_ns_tricks
-                self.ew_tricks = self._stored_ew_tricks
-                winner = self._stored_trick_winner
-                self.trick_winner = winner
-                self.trick_winner_cache = winner
-                self.logger.info(f"RESTORED trick counts from stored values: NS: {self.ns_tricks}, EW: {self.ew_tricks}")
-                
-                # Force immediate display update with restored values
-                self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-                self.trick_label.update()
-                self.trick_count_verified = True
-        
-        # Secondary verification if needed
-        if not self.trick_count_verified:
-            self.logger.warning("CLEAR_TRICK: Trick count not verified - this should not happen")
-            
-            # Recover using cached winner if available
-            winner = self.trick_winner_cache if self.trick_winner_cache is not None else self.trick_winner
-            if winner is not None:
-                self.logger.info(f"Recovering trick count using cached winner: {self.POSITIONS[winner]}")
-                # Force verification based on cached winner
-                old_ns = self.ns_tricks
-                old_ew = self.ew_tricks
-                
-                if winner in [0, 2]:  # South and North partnership
-                    if self.ns_tricks == old_ns:  # No increment happened
-                        self.ns_tricks = old_ns + 1
-                        self.logger.warning(f"NS TRICK COUNT FORCED from {old_ns} to {self.ns_tricks}")
-                else:  # East-West partnership
-                    if self.ew_tricks == old_ew:  # No increment happened
-                        self.ew_tricks = old_ew + 1
-                        self.logger.warning(f"EW TRICK COUNT FORCED from {old_ew} to {self.ew_tricks}")
-                
-                # Update display immediately
-                self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-                self.trick_label.update()  # More forceful update
-                self.update_idletasks()
-                self.last_trick_displayed = True
-                
-                self.trick_count_verified = True
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("ENTERING _clear_trick - Current trick counts: NS: %s, EW: %s", self.ns_tricks, self.ew_tricks)
+            self.logger.debug("Window state: Exists: %s, Viewable: %s, Mapped: %s", self.winfo_exists(), self.winfo_viewable(), self.winfo_ismapped())
         
         # Clear trick area
-        for frame in self.trick_frames:
-            for widget in frame.winfo_children():
-                widget.destroy()
-        
-        self.trick_card_views = [None, None, None, None]
-        
-        # Refresh all player hands to ensure proper display
-        for i in range(4):
-            self._refresh_player_hand(i)
+        self._hide_trick_cards()
         
         # Check if hand is complete
         if not any(player["hand"] for player in self.game.players):
             self._game_over()
         else:
-            # Ensure trick count is consistent with display - CRITICAL CHECK
-            trick_label_text = self.trick_label.cget("text")
-            expected_text = f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}"
-            if trick_label_text != expected_text:
-                self.logger.error(f"TRICK LABEL MISMATCH: Display shows '{trick_label_text}' but should be '{expected_text}'")
-                self.trick_label.config(text=expected_text)
-                # Force immediate update, not just idle tasks
-                self.trick_label.update()
+            # A hand has 13 tricks
+            assert 0 <= self.ns_tricks + self.ew_tricks <= 13, (self.ns_tricks, self.ew_tricks)
             
-            # Make sure display is up to date one more time - FINAL SAFETY CHECK
-            current_label = self.trick_label.cget("text")
-            expected_label = f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}"
-            if current_label != expected_label:
-                self.logger.warning(f"Display mismatch after _clear_trick! Shows '{current_label}' but should be '{expected_label}'")
-                self.trick_label.config(text=expected_label)
-                self.trick_label.update()
-                
-            # Final verification that trick counts are correct before proceeding
-            total_tricks = self.ns_tricks + self.ew_tricks
-            if total_tricks > 13:
-                self.logger.error(f"INVALID TOTAL TRICK COUNT: {total_tricks} (should be ≤ 13)")
-                # Correct by removing from the higher count
-                excess = total_tricks - 13
-                if self.ns_tricks >= self.ew_tricks:
-                    self.ns_tricks -= excess
-                else:
-                    self.ew_tricks -= excess
-                self.logger.info(f"Corrected trick counts: NS: {self.ns_tricks}, EW: {self.ew_tricks}")
-                self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-                self.trick_label.update()
-                
-            # Mark that trick was successfully displayed
-            self.last_trick_displayed = True
-                
-            # Log successful completion of _clear_trick
-            self.logger.info("_clear_trick completed successfully - About to set next player")
+            # Show the final counts; this is the one trick label update per trick
+            self._set_trick_label()
             
             # Use the cached winner if available, otherwise use trick_winner
             winner = self.trick_winner_cache if self.trick_winner_cache is not None else self.trick_winner
@@ -879,108 +697,72 @@ class BridgeGameWindow(tk.Tk):
             # Set the winner as the next player to lead
             self.game.current_player = winner
             self.game.last_trick_winner = winner  # Ensure last_trick_winner is set
-            self.logger.info(f"TRICK CLEARED - Final trick counts: NS: {self.ns_tricks}, EW: {self.ew_tricks}, Next trick led by: {self.POSITIONS[winner]}")
-            
-            # Clear stored trick values as they're no longer needed
-            if hasattr(self, '_stored_ns_tricks'):
-                delattr(self, '_stored_ns_tricks')
-            if hasattr(self, '_stored_ew_tricks'):
-                delattr(self, '_stored_ew_tricks')
-            if hasattr(self, '_stored_trick_winner'):
-                delattr(self, '_stored_trick_winner')
-            
-            # Log the state changes
-            self.logger.info(f"Setting player {self.trick_winner} ({self.POSITIONS[self.trick_winner]}) as next player (winner leads)")
-            self.logger.info(f"Current player set to: {self.game.current_player}")
-            self.logger.info(f"Last trick winner set to: {self.game.last_trick_winner}")
+            winner_name = self.POSITIONS[winner]
+            self.logger.debug("TRICK CLEARED - Final trick counts: NS: %s, EW: %s, Next trick led by: %s", self.ns_tricks, self.ew_tricks, winner_name)
             
             # Update UI for next trick
             self.waiting_for_trick_end = False
             self._highlight_current_player()
             
             # Provide detailed feedback about who leads and why
-            lead_explanation = f"Next trick - {self.POSITIONS[self.game.current_player]} must lead (winner of previous trick)"
-            self.logger.info(lead_explanation)
-            self.status_bar.config(text=lead_explanation)
+            lead_explanation = f"Next trick - {winner_name} must lead (winner of previous trick)"
+            self._set_status(lead_explanation)
             
             # Flash the winner's area to make it very clear who should lead
             self._flash_player_frame(self.trick_winner)
     
     def _highlight_current_player(self):
         """Highlight the current player's frame"""
-        # Reset all frames
-        for i, frame in enumerate([self.south_frame, self.west_frame, self.north_frame, self.east_frame]):
-            if i == self.game.current_player:
-                frame.config(bg='#006600')  # Brighter green for current player
-            else:
-                frame.config(bg='#004400')  # Regular green for others
+        # The frame colours and label are redrawn once Tk is idle
+        self._queue_ui('highlight', self._flush_highlight)
         
-        # Update current player label
-        self.current_player_label.config(text=f"Current Player: {self.POSITIONS[self.game.current_player]}")
+        # Only the current player's cards can be clicked
+        self._update_playable_cards()
+    
+    def _flush_highlight(self):
+        """Apply the current player highlight queued by _highlight_current_player."""
+        current = self.game.current_player
+        
+        # Only the previous and the new current player's frames change colour
+        if current != self.current_player_highlight:
+            if self.current_player_highlight is not None:
+                self.player_frames[self.current_player_highlight].config(bg='#004400')  # Regular green for others
+            self.player_frames[current].config(bg='#006600')  # Brighter green for current player
+            self.current_player_highlight = current
+            
+            # Update current player label
+            self.current_player_label.config(text=f"Current Player: {self.POSITIONS[current]}")
     
     def _game_over(self):
         """Handle end of game"""
-        self.logger.info(f"GAME OVER - Final trick counts: NS: {self.ns_tricks}, EW: {self.ew_tricks}, Verified: {self.trick_count_verified}")
+        self.logger.info("GAME OVER - Final trick counts: NS: %s, EW: %s", self.ns_tricks, self.ew_tricks)
         
-        # Final verification of trick counts
-        total_tricks = self.ns_tricks + self.ew_tricks
-        if total_tricks != 13:  # A complete bridge hand should have exactly 13 tricks
-            self.logger.error(f"TRICK COUNT ERROR: Total tricks should be 13 but is {total_tricks}")
-            
-            # Last chance to fix the counts - we'll distribute the missing/extra tricks
-            if total_tricks < 13:
-                missing = 13 - total_tricks
-                self.logger.warning(f"Missing {missing} tricks - fixing final counts")
-                # Distribute missing tricks - split them evenly or give to whoever has fewer
-                if self.ns_tricks <= self.ew_tricks:
-                    self.ns_tricks += missing
-                else:
-                    self.ew_tricks += missing
-            elif total_tricks > 13:
-                extra = total_tricks - 13
-                self.logger.warning(f"Extra {extra} tricks - fixing final counts")
-                # Remove extra tricks from whoever has more
-                if self.ns_tricks >= self.ew_tricks:
-                    self.ns_tricks -= min(extra, self.ns_tricks)
-                else:
-                    self.ew_tricks -= min(extra, self.ew_tricks)
-            
-            # Update display one last time
-            self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-            self.trick_label.update_idletasks()
-            self.logger.info(f"FINAL CORRECTED TRICK COUNTS: NS: {self.ns_tricks}, EW: {self.ew_tricks}, Total: {self.ns_tricks + self.ew_tricks}")
+        # Every trick is counted once in _end_trick, so a complete hand has 13
+        assert self.ns_tricks + self.ew_tricks == 13, "trick counts must total 13 at game over"
         
-        # Force update of the display one last time
-        self.trick_label.config(text=f"Tricks: NS: {self.ns_tricks} | EW: {self.ew_tricks}")
-        self.trick_label.update_idletasks()
+        # Update the display once, and paint it before the modal dialog blocks
+        self._set_trick_label()
+        self.update_idletasks()
         
         # Log debug info about clear_trick calls
-        self.logger.info(f"GAME OVER DEBUG - clear_trick_called: {self.clear_trick_called}, clear_trick_job: {self.clear_trick_job}")
+        self.logger.debug("GAME OVER DEBUG - clear_trick_called: %s", self.clear_trick_called)
         
         messagebox.showinfo("Game Over", f"Game completed!\nFinal score:\nNorth-South: {self.ns_tricks}\nEast-West: {self.ew_tricks}")
-        self.status_bar.config(text="Game over. North-South won the game!" if self.ns_tricks > self.ew_tricks else 
-                              "Game over. East-West won the game!" if self.ew_tricks > self.ns_tricks else
-                              "Game over. It's a tie!")
+        self._set_status("Game over. North-South won the game!" if self.ns_tricks > self.ew_tricks else 
+                         "Game over. East-West won the game!" if self.ew_tricks > self.ns_tricks else
+                         "Game over. It's a tie!")
         
     def _ensure_visibility(self):
         """Final check to make sure window is visible and has focus"""
         self.logger.info("Performing final visibility check")
+        # Make sure window appears on top and gets focus
+        self.deiconify()  # Ensure window is not minimized
+        self.lift()      # Lift window to top of stacking order
+        self.focus_force()  # Force focus to this window
+        
         # Update geometry info to ensure window is properly mapped
         self.update_idletasks()
         
-        # Check if Tkinter's after() mechanism is working
-        import time
-        start_time = time.time()
-        self.after_test_completed = False
-        
-        def after_test():
-            elapsed = time.time() - start_time
-            self.after_test_completed = True
-            self.logger.info(f"after() test completed after {elapsed:.4f} seconds")
-            
-        self.logger.info("Testing Tkinter after() mechanism...")
-        self.after(500, after_test)  # Should run after 500ms
-        
     def _on_bidding_complete(self):
         """Handle completion of the bidding phase."""
         self.logger.info("Bidding complete")
@@ -994,7 +776,7 @@ class BridgeGameWindow(tk.Tk):
         
         # Set up the play phase
         if self.game.contract is None:
-            self.status_bar.config(text="All players passed. Starting a new game.")
+            self._set_status("All players passed. Starting a new game.")
             # Could automatically start a new game here
         else:
             # Determine first leader (player to left of declarer)
@@ -1016,7 +798,7 @@ class BridgeGameWindow(tk.Tk):
             status_text = (f"Contract: {contract_str} by {declarer_name}. "
                           f"{dummy_name} is dummy. "
                           f"{self.POSITIONS[first_leader]} to lead.")
-            self.status_bar.config(text=status_text)
+            self._set_status(status_text)
             
             # Update UI to show current player
             self._highlight_current_player()
@@ -1034,47 +816,17 @@ class BridgeGameWindow(tk.Tk):
         # Ensure we're in bidding state
         self.game.current_state = "bidding"
         
-        # Make sure all frames are visible
-        self.north_frame.place(relx=0.5, rely=0.02, anchor='n')
-        self.south_frame.place(relx=0.5, rely=0.98, anchor='s')
-        self.east_frame.place(relx=0.98, rely=0.5, anchor='e')
-        self.west_frame.place(relx=0.02, rely=0.5, anchor='w')
-        self.center_frame.place(relx=0.5, rely=0.5, anchor='center')
-        
-        # Make sure we have valid hands
-        if not all(len(player["hand"]) == 13 for player in self.game.players):
-            self.logger.warning("Invalid hand count detected, re-dealing cards")
-            self.game.deal_cards()
-        
-        # Import hand evaluation for logging hand values
-        from core.hand_evaluation import calculate_hcp, count_suit_length, is_balanced
-        
-        # Log the hands with evaluation info for debugging
-        for i, player in enumerate(self.game.players):
-            hand = player["hand"]
-            try:
-                # Basic hand info
-                hand_str = ", ".join(f"{card.value_name}{card.suit}" for card in sorted(hand, key=lambda c: (c.suit, -c.value)))
-                
-                # Calculate HCP and distribution
-                hcp = calculate_hcp(hand)
-                suit_lengths = count_suit_length(hand)
-                balanced = is_balanced(suit_lengths)
-                
-                # Log with evaluation
-                self.logger.info(f"Player {i} ({self.POSITIONS[i]}) hand: {hand_str}")
-                self.logger.info(f"  - HCP: {hcp}, Distribution: {suit_lengths}, Balanced: {balanced}")
-            except Exception as e:
-                self.logger.error(f"Error evaluating player {i} hand: {e}")
+        # deal_cards already checks the deal, so only assert it here
+        assert all(len(player["hand"]) == 13 for player in self.game.players)
         
-        # Show all hands face-up for bidding
+        # Show all hands face-up for bidding (this also logs the hands)
         self._display_all_hands_for_bidding()
         
         # Show and initialize bidding box
         self.bidding_box.show()
         
         # Update status
-        self.status_bar.config(text="Bidding phase - make your bid")
+        self._set_status("Bidding phase - make your bid")
         
         # All players are human-controlled, so no AI bidding is needed
     
@@ -1082,203 +834,171 @@ class BridgeGameWindow(tk.Tk):
         """Display all hands face-up for the bidding phase."""
         self.logger.info("Displaying all hands for bidding phase")
         
-        # Check if cards have been dealt
-        total_cards = sum(len(player["hand"]) for player in self.game.players)
-        self.logger.info(f"Total cards in all hands: {total_cards}")
-        
-        # Ensure a fresh deal if any issues are detected
-        if total_cards != 52:
-            self.logger.warning(f"Incorrect card count: {total_cards}. Re-dealing cards.")
-            # Reinitialize the game completely to ensure clean state
-            self.game = BridgeGame()
-            self.game.initialize_players()
-            self.game.new_game()  # Use new_game instead of just deal_cards to reset everything
-            
-            # Verify the new deal
-            total_cards = sum(len(player["hand"]) for player in self.game.players)
-            self.logger.info(f"After re-dealing, total cards: {total_cards}")
-            
-            if total_cards != 52:
-                self.logger.error(f"Still have incorrect card count: {total_cards} after re-dealing!")
-                messagebox.showerror("Card Dealing Error", f"Failed to deal cards correctly. Got {total_cards} cards instead of 52.")
-        
-        # Import hand evaluation for showing hand statistics
-        from core.hand_evaluation import calculate_hcp, count_suit_length, is_balanced
-        
-        # Log detailed hand information for debugging
-        for i, player in enumerate(self.game.players):
-            hand = player["hand"]
-            try:
-                # Calculate hand statistics
-                hcp = calculate_hcp(hand)
-                suit_lengths = count_suit_length(hand)
-                balanced = is_balanced(suit_lengths)
-                
-                # Sort hand for logging
-                sorted_hand = sorted(hand, key=lambda c: (c.suit, -c.value))
-                hand_str = ", ".join(f"{card.value_name}{card.suit}" for card in sorted_hand)
-                
-                self.logger.info(f"Player {i} ({self.POSITIONS[i]}) hand for display:")
-                self.logger.info(f"  Cards: {hand_str}")
-                self.logger.info(f"  HCP: {hcp}, Distribution: ♠{suit_lengths['S']} ♥{suit_lengths['H']} ♦{suit_lengths['D']} ♣{suit_lengths['C']}, Balanced: {balanced}")
-            except Exception as e:
-                self.logger.error(f"Error formatting player {i} hand: {e}")
+        # Take the previous deal's cards out of the hands; the pooled views are
+        # packed again below in the new hand order
+        for card_views in self.card_views:
+            for card_view in card_views:
+                card_view.pack_forget()
         
         # Clear existing cards
         self.card_views = [[] for _ in range(4)]
-        
-        # Make sure frames are properly positioned
-        self.north_frame.place(relx=0.5, rely=0.1, anchor='n')
-        self.south_frame.place(relx=0.5, rely=0.9, anchor='s')
-        self.east_frame.place(relx=0.8, rely=0.5, anchor='e')
-        self.west_frame.place(relx=0.2, rely=0.5, anchor='w')
-        
-        # Clear existing content in frames
-        for frame in [self.north_frame, self.south_frame, self.east_frame, self.west_frame]:
-            for widget in frame.winfo_children():
-                widget.destroy()
-        
-        # Create frames for each player's cards
-        frames = []
-        
-        # South (player 0)
-        south_cards_frame = tk.Frame(self.south_frame, bg='#004400')
-        south_cards_frame.pack(pady=10, fill=tk.BOTH, expand=True)
-        frames.append((south_cards_frame, 'bottom', "South (You)"))
-        
-        # West (player 1)
-        west_cards_frame = tk.Frame(self.west_frame, bg='#004400')
-        west_cards_frame.pack(pady=10, fill=tk.BOTH, expand=True)
-        frames.append((west_cards_frame, 'left', "West"))
-        
-        # North (player 2)
-        north_cards_frame = tk.Frame(self.north_frame, bg='#004400')
-        north_cards_frame.pack(pady=10, fill=tk.BOTH, expand=True)
-        frames.append((north_cards_frame, 'top', "North"))
-        
-        # East (player 3)
-        east_cards_frame = tk.Frame(self.east_frame, bg='#004400')
-        east_cards_frame.pack(pady=10, fill=tk.BOTH, expand=True)
-        frames.append((east_cards_frame, 'right', "East"))
-        
-        # Import hand evaluation functions
-        from core.hand_evaluation import calculate_hcp, count_suit_length, is_balanced
+        self._playable_player = None
         
         # Add player hand information labels (HCP and distribution)
-        for player_idx, (frame, position, player_name) in enumerate(frames):
-            # First add player name label
-            name_label = tk.Label(frame, 
-                              text=player_name,
-                              font=('Arial', 12, 'bold'), 
-                              fg='white', bg='#004400')
-            name_label.pack(side=tk.TOP, pady=(5, 0))
+        for player_idx, position in enumerate(self._HAND_POSITIONS):
+            # Build the hand's labels and suit frames on the first deal only
+            # The seat name label goes then too, since each hand carries its own name label
+            if self._hand_widgets[player_idx] is None:
+                self._seat_labels[player_idx].destroy()
+                self._hand_widgets[player_idx] = self._build_hand_widgets(player_idx, position)
+            widgets = self._hand_widgets[player_idx]
             
-            # Get and sort cards
+            # Get the cards (the core keeps hands sorted)
             hand = self.game.players[player_idx]['hand']
             
-            # Skip if hand is empty (shouldn't happen but just in case)
+            # Flag an empty hand (shouldn't happen but just in case)
             if not hand:
-                error_label = tk.Label(frame, text="No cards available!",
-                                    font=('Arial', 12, 'bold'), fg='red', bg='#004400')
-                error_label.pack(pady=20)
+                widgets['error'].pack(pady=20)
                 continue
+            widgets['error'].pack_forget()
             
-            # Sort cards for display
-            hand = sorted(hand, key=lambda c: (c.suit, -c.value))
-            
-            # Calculate HCP and suit lengths for display
-            hcp = calculate_hcp(hand)
-            suit_lengths = count_suit_length(hand)
+            # HCP and suit lengths from the deal; nothing has been played yet
+            player = self.game.players[player_idx]
+            hcp = player['hcp']
+            suit_lengths = player['suit_counts']
             balanced = is_balanced(suit_lengths)
             dist_points = sum(max(0, length-4) for length in suit_lengths.values())
             
-            # Add info label with HCP and distribution
+            # Update info labels with HCP and distribution
             distribution_str = f"♠{suit_lengths['S']} ♥{suit_lengths['H']} ♦{suit_lengths['D']} ♣{suit_lengths['C']}"
             total_pts = f"{hcp}{'+'+ str(dist_points) if dist_points > 0 else ''}"
             
-            info_frame = tk.Frame(frame, bg='#004400')
-            info_frame.pack(side=tk.TOP, pady=(5, 10), fill=tk.X)
+            # Log detailed hand information for debugging, reusing the display strings
+            if self.logger.isEnabledFor(logging.INFO):
+                # The core keeps hands sorted, so log them as they are
+                hand_str = ", ".join(f"{card.value_name}{card.suit}" for card in hand)
+                self.logger.info("Player %s (%s) hand for display:", player_idx, self.POSITIONS[player_idx])
+                self.logger.info("  Cards: %s", hand_str)
+                self.logger.info("  HCP: %s, Distribution: %s, Balanced: %s", hcp, distribution_str, balanced)
             
             # HCP label with colorful background based on strength
             hcp_bg = '#006600' if hcp >= 12 else '#444400' if hcp >= 8 else '#440000'
-            hcp_label = tk.Label(info_frame, 
-                              text=f"HCP: {total_pts}",
-                              font=('Arial', 10, 'bold'),
-                              fg='white', bg=hcp_bg,
-                              padx=5, pady=2)
-            hcp_label.pack(side=tk.LEFT, padx=5)
-            
-            # Distribution with colorful suit symbols
-            dist_label = tk.Label(info_frame,
-                              text=distribution_str,
-                              font=('Arial', 10),
-                              fg='white', bg='#004400')
-            dist_label.pack(side=tk.LEFT, padx=5)
-            
-            # Balanced/Unbalanced indicator
-            balance_label = tk.Label(info_frame,
-                                  text=f"{'Balanced' if balanced else 'Unbalanced'}",
-                                  font=('Arial', 10),
-                                  fg='white', bg='#004400')
-            balance_label.pack(side=tk.LEFT, padx=5)
-            
-            # Create a subframe for the cards with a slight border
-            cards_subframe = tk.Frame(frame, bg='#003300', bd=2, relief=tk.GROOVE)
-            cards_subframe.pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
-            
-            # Create a frame for each suit to organize cards
-            suit_frames = {}
-            for suit_name, suit_symbol, color in [
-                ('S', '♠', 'white'),  # Changed to white for better visibility
-                ('H', '♥', 'red'),
-                ('D', '♦', 'red'),
-                ('C', '♣', 'white')
-            ]:
-                # Create frame with background color matching the suit
-                bg_color = '#000055' if suit_name in ['S', 'C'] else '#550000'
-                suit_frame = tk.Frame(cards_subframe, bg=bg_color, bd=1, relief=tk.RAISED)
-                
-                # For East/West, stack suits vertically
-                # For North/South, arrange suits horizontally
-                if position in ['left', 'right']:  # East and West
-                    suit_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=8)  # Stack suit frames vertically
-                else:  # North and South
-                    suit_frame.pack(side=tk.LEFT, fill=tk.Y, padx=8, pady=5)  # Arrange suit frames horizontally
-                
-                # Add suit label
-                suit_label = tk.Label(suit_frame, 
-                                   text=suit_symbol, 
-                                   font=('Arial', 12, 'bold'), 
-                                   fg=color, bg=bg_color)
-                suit_label.pack(side=tk.TOP if position in ['left', 'right'] else tk.LEFT, padx=3, pady=3)
-                
-                suit_frames[suit_name] = suit_frame
+            widgets['hcp'].config(text=f"HCP: {total_pts}", bg=hcp_bg)
+            widgets['dist'].config(text=distribution_str)
+            widgets['balance'].config(text=f"{'Balanced' if balanced else 'Unbalanced'}")
             
             # Add cards to appropriate suit frames
+            suit_frames = widgets['suit_frames']
+            
+            # Cards run horizontally within each suit for every seat; a
+            # vertical stack of 13 cards does not fit beside the table
             for card in hand:
-                suit = card.suit
-                
-                # Create CardView instead of Button for consistent handling
-                card_view = CardView(suit_frames[suit], 
-                                   card=card,
-                                   face_up=True,
-                                   callback=self._on_card_click)
-                
-                # Store player index in card view
-                card_view.player_idx = player_idx
-                
-                # For East/West, stack cards vertically within each suit
-                # For North/South, arrange cards horizontally within each suit
-                if position in ['left', 'right']:  # East and West
-                    # Stack cards vertically
-                    card_view.pack(side=tk.TOP, pady=4)  # Increased vertical spacing
-                else:  # North and South
-                    # Arrange cards horizontally
-                    card_view.pack(side=tk.LEFT, padx=4, pady=2)  # Increased horizontal spacing
+                # Reuse the pooled CardView for this card
+                card_view = self._card_view_for(card, player_idx)
+                card_view.pack(in_=suit_frames[card.suit], side=tk.LEFT, padx=2, pady=2)
                 
                 # Store the card view for later reference
                 self.card_views[player_idx].append(card_view)
     
+    def _build_hand_widgets(self, player_idx, position):
+        """Create the name, info labels and suit frames of one hand.
+
+        They are made once and kept in the player's cards frame; each deal
+        only updates the label texts and packs the cards into the suit frames.
+        """
+        frame = self.cards_frames[player_idx]
+        
+        # First add player name label
+        name_label = tk.Label(frame, 
+                          text=self._SEAT_NAMES[player_idx],
+                          font=self._fonts['hand_label'], 
+                          fg='white', bg='#004400')
+        name_label.pack(side=tk.TOP, pady=(5, 0))
+        
+        # Shown only if the hand is empty
+        error_label = tk.Label(frame, text="No cards available!",
+                            font=self._fonts['hand_label'], fg='red', bg='#004400')
+        
+        info_frame = tk.Frame(frame, bg='#004400')
+        info_frame.pack(side=tk.TOP, pady=(5, 10), fill=tk.X)
+        
+        # HCP label; its text and strength colour are set per deal
+        hcp_label = tk.Label(info_frame, 
+                          font=self._fonts['info_bold'],
+                          fg='white',
+                          padx=5, pady=2)
+        hcp_label.pack(side=tk.LEFT, padx=5)
+        
+        # Distribution with colorful suit symbols
+        dist_label = tk.Label(info_frame,
+                          font=self._fonts['info'],
+                          fg='white', bg='#004400')
+        dist_label.pack(side=tk.LEFT, padx=5)
+        
+        # Balanced/Unbalanced indicator
+        balance_label = tk.Label(info_frame,
+                              font=self._fonts['info'],
+                              fg='white', bg='#004400')
+        balance_label.pack(side=tk.LEFT, padx=5)
+        
+        # Create a subframe for the cards with a slight border
+        cards_subframe = tk.Frame(frame, bg='#003300', bd=2, relief=tk.GROOVE)
+        cards_subframe.pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
+        
+        # Create a frame for each suit to organize cards
+        suit_frames = {}
+        for suit_name, suit_symbol, color, bg_color in self._SUIT_STYLES:
+            # Create frame with background color matching the suit
+            suit_frame = tk.Frame(cards_subframe, bg=bg_color, bd=1, relief=tk.RAISED)
+            
+            # For East/West, stack suits vertically
+            # For North/South, arrange suits horizontally
+            if position in ['left', 'right']:  # East and West
+                suit_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=8)  # Stack suit frames vertically
+            else:  # North and South
+                suit_frame.pack(side=tk.LEFT, fill=tk.Y, padx=8, pady=5)  # Arrange suit frames horizontally
+            
+            # Add suit label
+            suit_label = tk.Label(suit_frame, 
+                               text=suit_symbol, 
+                               font=self._fonts['hand_label'], 
+                               fg=color, bg=bg_color)
+            suit_label.pack(side=tk.LEFT, padx=3, pady=3)
+            
+            suit_frames[suit_name] = suit_frame
+        
+        return {
+            'error': error_label,
+            'hcp': hcp_label,
+            'dist': dist_label,
+            'balance': balance_label,
+            'suit_frames': suit_frames
+        }
+    
+    def _card_view_for(self, card, player_idx):
+        """Return the pooled CardView for a card, ready to be packed into a hand.
+
+        Each of the 52 cards gets one CardView for the lifetime of the window.
+        They are children of the left container, so they outlive the suit
+        frames of a deal and can be packed into the next deal's frames with in_.
+        """
+        card_view = self._card_pool.get((card.suit, card.value))
+        if card_view is None:
+            card_view = CardView(self.left_container,
+                                 card=card,
+                                 face_up=True,
+                                 callback=self._on_card_click,
+                                 font=self._fonts['large'])
+            self._card_pool[(card.suit, card.value)] = card_view
+        else:
+            # The deck deals fresh Card objects, so point the view at this one
+            card_view.card = card
+            card_view.enable()
+        
+        # Store player index in card view
+        card_view.player_idx = player_idx
+        return card_view
+    
     def _prepare_cards_for_play(self):
         """Prepare cards for the playing phase."""
         # Get first leader (player to left of declarer)
@@ -1287,141 +1007,88 @@ class BridgeGameWindow(tk.Tk):
         # Set the game's current player to the first leader
         self.game.current_player = first_leader
         
-        self.logger.info(f"Setting up play phase - First leader: {self.POSITIONS[first_leader]}")
+        self.logger.info("Setting up play phase - First leader: %s", self.POSITIONS[first_leader])
         
-        # Enable/disable cards based on first leader
+        # Gray out the other hands. The first leader's cards are still enabled
+        # from the deal, so they are left alone rather than disabled and re-enabled
         for player_idx, card_views in enumerate(self.card_views):
-            for card_view in card_views:
-                if player_idx == first_leader:
-                    # Enable clicking for first leader's cards
-                    card_view.callback = self._on_card_click  # Set callback first
-                    card_view.bind("<Button-1>", lambda e, cv=card_view: self._on_card_click(cv))
-                    card_view.config(cursor="hand2", bg='white')
-                    self.logger.info(f"Enabled card {card_view.card} for {self.POSITIONS[player_idx]}")
-                else:
-                    # Disable clicking for other players' cards
-                    card_view.callback = None
-                    card_view.unbind("<Button-1>")
-                    card_view.config(cursor="", bg='#f0f0f0')  # Gray out cards
-                    self.logger.info(f"Disabled card {card_view.card} for {self.POSITIONS[player_idx]}")
+            if player_idx != first_leader:
+                for card_view in card_views:
+                    card_view.disable()
+        self._playable_player = first_leader
         
         # Update UI
         self._highlight_current_player()
         
         # Set status text
         status_text = f"{self.POSITIONS[first_leader]} to lead"
-        self.status_bar.config(text=status_text)
+        self._set_status(status_text)
         
         # Flash the leader's frame to make it clear who should play
         self._flash_player_frame(first_leader)
         
         # Log completion
-        self.logger.info(f"Play phase setup complete - {self.POSITIONS[first_leader]} to lead")
+        self.logger.info("Play phase setup complete - %s to lead", self.POSITIONS[first_leader])
     
-    def _hide_play_area(self):
-        """Hide the play area during bidding - NOT USED, we keep cards visible during bidding."""
-        pass  # No longer hiding the play area
-    
-    def _show_play_area(self):
-        """Show the play area after bidding is complete - NOT USED, cards stay visible throughout."""
-        pass  # No longer needed since cards are always visible
-        
-        # Get actual window geometry after rendering
-        actual_geometry = self.geometry()
-        self.logger.info(f"Actual window geometry: {actual_geometry}")
-        
-        # Check if window is visible on screen
-        if self.winfo_viewable():
-            self.logger.info("Window is confirmed viewable")
-        else:
-            self.logger.warning("Window might not be viewable - forcing visibility")
-            self.deiconify()
-            self.lift()
-            self.focus_force()
-            
-        # Force another update and lift
-        self.update()
-        self.lift()
-        self.focus_force()
-        
     def _flash_player_frame(self, player_idx):
         """Flash a player's frame to draw attention to it"""
-        frames = [self.south_frame, self.west_frame, self.north_frame, self.east_frame]
-        frame = frames[player_idx]
+        frame = self.player_frames[player_idx]
         
-        # Original color
-        original_bg = frame.cget("bg")
+        # Only one flash runs at a time, so finish any earlier one first
+        self._cancel_flash()
         
-        # Flash sequence (bright yellow -> original)
-        def flash_on():
-            frame.config(bg='#FFFF00')  # Bright yellow
-            self.after(300, lambda: flash_off())
-            
-        def flash_off():
-            frame.config(bg='#006600')  # Brighter green
-            
-        # Start flashing
-        flash_on()
-        
-    def _refresh_player_hand(self, player_idx):
-        """Refresh a player's hand display after playing a card"""
-        # Get the frame for this player's cards
-        frames = [self.south_frame, self.west_frame, self.north_frame, self.east_frame]
-        frame = frames[player_idx]
-        
-        # Clear existing card displays
-        for widget in frame.winfo_children():
-            if isinstance(widget, tk.Frame):
-                widget.destroy()
-                
-        # Create a new frame for the cards
-        positions = ['bottom', 'left', 'top', 'right']
-        cards_frame = tk.Frame(frame, bg='#004400')
-        cards_frame.pack(pady=30)
-        
-        # Get and sort remaining cards
-        hand = sorted(self.game.players[player_idx]['hand'], 
-                     key=lambda c: (c.suit, -c.value))
+        # Apply any queued seat highlight now; a later flush would otherwise
+        # repaint this frame green before the flash is ever drawn
+        self._flush_highlight()
         
-        # Display remaining cards with proper spacing
-        current_suit = None
-        position = positions[player_idx]
-        
-        # Remove this player's card views from tracking
-        self.card_views[player_idx] = []
-        
-        # Group cards by suit for better spacing
-        for card in hand:
-            suit = card.suit
-            
-            if current_suit is not None and suit != current_suit:
-                # Add a bit more space between suits
-                spacer = tk.Label(cards_frame, text=" ", bg='#004400', width=1)
-                if position in ['left', 'right']:
-                    spacer.pack(side=tk.TOP)  # Vertical spacing for East/West
-                else:
-                    spacer.pack(side=tk.LEFT)  # Horizontal spacing for North/South
-                    
-            current_suit = suit
-            
-            # Create card view with callback
-            card_view = CardView(cards_frame, card=card, face_up=True, callback=self._on_card_click)
-            
-            # Store the player index in the card view
-            card_view.player_idx = player_idx
-            
-            if position in ['left', 'right']:  # East and West
-                card_view.pack(side=tk.TOP, pady=4)  # Match the spacing from bidding display
-            else:  # North and South
-                card_view.pack(side=tk.LEFT, padx=4)  # Match the spacing from bidding display
-            
-            # Store the card view for later reference
-            self.card_views[player_idx].append(card_view)
+        # Flash sequence (bright yellow -> brighter green)
+        frame.config(bg='#FFFF00')  # Bright yellow
+        self._flash_idx = player_idx
+        self._flash_job = self.after(300, self._end_flash)
+    
+    def _end_flash(self):
+        """Take the flashed frame out of its highlight"""
+        self._flash_job = None
+        # Go back to whichever colour the seat should have now
+        if self._flash_idx == self.current_player_highlight:
+            self.player_frames[self._flash_idx].config(bg='#006600')  # Brighter green for current player
+        else:
+            self.player_frames[self._flash_idx].config(bg='#004400')  # Regular green for others
+    
+    def _cancel_flash(self):
+        """Cancel a pending flash, putting its frame back to its seat colour"""
+        if self._flash_job:
+            self.after_cancel(self._flash_job)
+            self._end_flash()
+        
+    def _refresh_player_hand(self, player_idx, card):
+        """Hide the card view of a card that has left a player's hand.
+
+        The card views built at deal time are kept and only the played one
+        is unpacked, so the rest of the hand is never touched.
+        """
+        # The pool holds one view per card, so no need to scan the hand
+        card_view = self._card_pool[(card.suit, card.value)]
+        card_view.disable()
+        card_view.pack_forget()
+        self.card_views[player_idx].remove(card_view)
+
+    def _update_playable_cards(self):
+        """Make only the current player's cards clickable."""
+        current = self.game.current_player
+        if current == self._playable_player:
+            return
+        if self._playable_player is not None:
+            for card_view in self.card_views[self._playable_player]:
+                card_view.disable()
+        for card_view in self.card_views[current]:
+            card_view.enable()
+        self._playable_player = current
 
     def _save_game(self):
         messagebox.showinfo("Save Game", "Game saving not implemented yet")
-        self.status_bar.config(text="Game saved")
+        self._set_status("Game saved")
 
     def _load_game(self):
         messagebox.showinfo("Load Game", "Game loading not implemented yet")
-        self.status_bar.config(text="Game loaded")
+        self._set_status("Game loaded")
@@ -9,7 +9,6 @@ It initializes the GUI and handles the main application loop.
 import os
 import sys
 import logging
-import traceback
 import tkinter as tk
 from datetime import datetime
 
@@ -51,9 +50,10 @@ def main():
         
     except ImportError as e:
         logger.error(f"Failed to import required modules: {e}")
-        tk.messagebox.showerror("Import Error", 
-                                f"Failed to load required modules.\n\nError: {e}\n\n"
-                                "Make sure all dependencies are installed.")
+        from tkinter import messagebox  # Only needed to report the error
+        messagebox.showerror("Import Error", 
+                             f"Failed to load required modules.\n\nError: {e}\n\n"
+                             "Make sure all dependencies are installed.")
         sys.exit(1)
         
     except tk.TclError as e:
@@ -62,14 +62,16 @@ def main():
         sys.exit(1)
         
     except Exception as e:
+        import traceback  # Only needed to report the error
         logger.critical(f"Unhandled exception: {e}")
         logger.critical(traceback.format_exc())
         
         # Try to show error dialog, but this might fail if the error is early
         try:
-            tk.messagebox.showerror("Error", 
-                                   f"An unexpected error occurred:\n\n{e}\n\n"
-                                   f"Please check the log file at:\n{log_file}")
+            from tkinter import messagebox
+            messagebox.showerror("Error", 
+                                f"An unexpected error occurred:\n\n{e}\n\n"
+                                f"Please check the log file at:\n{log_file}")
         except:
             print(f"Critical error: {e}")
             print(f"See log file for details: {log_file}")
@@ -14,6 +14,8 @@ import os
 import logging
 from typing import List
 
+import pytest
+
 # Add the parent directory to the path to allow importing the core modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -27,6 +29,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger("BridgeTest")
 
+@pytest.fixture(scope="module")
+def game():
+    """One dealt game shared by the tests; each test restarts the bidding."""
+    game = BridgeGame()
+    game.new_game()
+    return game
+
 def test_bid_creation():
     """Test creating various types of bids."""
     logger.info("\n=== TESTING BID CREATION ===")
@@ -58,6 +67,33 @@ def test_bid_creation():
         bid = Bid.from_string(bid_str)
         logger.info(f"From string '{bid_str}': {bid}")
 
+def test_from_string_cache():
+    """Test that cached bids from from_string are equal and safe to share."""
+    logger.info("\n=== TESTING FROM_STRING CACHE ===")
+    
+    # Repeated parses hand out the same, equal bid
+    for bid_str in ["1C", "3NT", "Pass", "Double"]:
+        first = Bid.from_string(bid_str)
+        second = Bid.from_string(bid_str)
+        assert first is second, f"{bid_str} should be parsed once and shared"
+        assert first == second
+    
+    # Parsed bids equal the bids built directly
+    assert Bid.from_string("1C") == Bid(BidType.NORMAL, 1, 'C')
+    assert Bid.from_string(" 1C ") is Bid.from_string("1C")
+    
+    # A shared bid cannot be changed by one of its users
+    one_club = Bid.from_string("1C")
+    for name, value in [("level", 7), ("denomination", 'NT'), ("rank", 99)]:
+        with pytest.raises(AttributeError):
+            setattr(one_club, name, value)
+    with pytest.raises(AttributeError):
+        del one_club.level
+    assert Bid.from_string("1C") == Bid(BidType.NORMAL, 1, 'C')
+    assert Bid.from_string("1C").get_rank() == 6
+    
+    logger.info("From string cache tests passed")
+
 def test_bid_comparison():
     """Test bid comparison logic."""
     logger.info("\n=== TESTING BID COMPARISON ===")
@@ -75,24 +111,25 @@ def test_bid_comparison():
         Bid(BidType.REDOUBLE)
     ]
     
-    # Test bid ordering
-    for i, bid1 in enumerate(bids):
-        for j, bid2 in enumerate(bids):
-            if i == j:
-                assert bid1 == bid2, f"{bid1} should equal {bid2}"
-            elif i < j and bid1.bid_type == BidType.NORMAL and bid2.bid_type == BidType.NORMAL:
-                assert bid1 < bid2, f"{bid1} should be less than {bid2}"
-                assert bid2 > bid1, f"{bid2} should be greater than {bid1}"
+    # Every bid equals itself
+    for bid in bids:
+        assert bid == bid, f"{bid} should equal itself"
+    
+    # Normal bids are listed in ascending order; comparing neighbours covers
+    # the whole order, since bids compare by a single rank
+    normal_bids = [bid for bid in bids if bid.bid_type == BidType.NORMAL]
+    for lower, higher in zip(normal_bids, normal_bids[1:]):
+        assert lower < higher, f"{lower} should be less than {higher}"
+        assert higher > lower, f"{higher} should be greater than {lower}"
     
     logger.info("Bid comparison tests passed")
 
-def test_bidding_sequence():
+def test_bidding_sequence(game):
     """Test a basic bidding sequence."""
     logger.info("\n=== TESTING BIDDING SEQUENCE ===")
     
-    # Create a new game
-    game = BridgeGame()
-    game.new_game()
+    # Start a fresh auction on the shared deal
+    game.start_bidding()
     
     # Check initial state
     assert game.current_state == "bidding"
@@ -120,6 +157,7 @@ def test_bidding_sequence():
     # Check final state
     assert game.current_state == "playing"
     assert game.contract == "4H"
+    assert game.determine_final_contract() == "4♥"
     
     # Verify declarer (should be South, who first bid Hearts)
     assert game.declarer == 0
@@ -128,12 +166,11 @@ def test_bidding_sequence():
     logger.info(f"Declarer: Player {game.declarer} ({['South', 'West', 'North', 'East'][game.declarer]})")
     logger.info(f"Dummy: Player {game.dummy} ({['South', 'West', 'North', 'East'][game.dummy]})")
 
-def test_bid_validation():
+def test_bid_validation(game):
     """Test bid validation rules."""
     logger.info("\n=== TESTING BID VALIDATION ===")
     
-    game = BridgeGame()
-    game.new_game()
+    game.start_bidding()
     
     # Test 1: First bid - anything valid except Double/Redouble
     valid_first_bids = ["Pass", "1C", "1D", "1H", "1S", "1NT", "7NT"]
@@ -162,8 +199,7 @@ def test_bid_validation():
         assert not game.is_valid_bid(bid), f"{bid_str} should be invalid after 1H"
     
     # Test 3: Double only valid for opponent's bid
-    game = BridgeGame()
-    game.new_game()
+    game.start_bidding()
     
     game.place_bid(0, "1H")  # South bids 1H
     
@@ -174,15 +210,24 @@ def test_bid_validation():
     
     # North can redouble (partner's bid was doubled)
     assert game.is_valid_bid(Bid(BidType.REDOUBLE)), "North should be able to redouble after West doubled"
-    
+
+    # Test 4: Double not valid for partner's bid
+    game.start_bidding()
+
+    game.place_bid(0, "1H")    # South bids 1H
+    game.place_bid(1, "Pass")  # West passes
+
+    # North cannot double partner's bid
+    assert game.last_bidder == 0
+    assert not game.is_valid_bid(Bid(BidType.DOUBLE)), "North should not be able to double South's bid"
+
     logger.info("Bid validation tests passed")
 
-def test_all_pass():
+def test_all_pass(game):
     """Test when all players pass."""
     logger.info("\n=== TESTING ALL PASS ===")
     
-    game = BridgeGame()
-    game.new_game()
+    game.start_bidding()
     
     # All players pass
     game.place_bid(0, "Pass")  # South passes
@@ -193,15 +238,15 @@ def test_all_pass():
     # Check final state
     assert game.current_state == "playing"
     assert game.contract is None
+    assert game.determine_final_contract() == "Pass"
     
     logger.info("All pass test passed")
 
-def test_complex_bidding():
+def test_complex_bidding(game):
     """Test a more complex bidding sequence with competition."""
     logger.info("\n=== TESTING COMPLEX BIDDING ===")
     
-    game = BridgeGame()
-    game.new_game()
+    game.start_bidding()
     
     # Define a competitive bidding sequence
     bidding_sequence = [
@@ -227,6 +272,7 @@ def test_complex_bidding():
     # Check final state
     assert game.current_state == "playing"
     assert game.contract == "4SX"  # 4 Spades doubled
+    assert game.determine_final_contract() == "4♠X"
     
     # Verify declarer (should be North, who first bid Spades)
     assert game.declarer == 2
@@ -239,12 +285,17 @@ def main():
     logger.info("STARTING BIDDING TESTS")
     
     try:
+        # Deal once, as the pytest fixture does
+        game = BridgeGame()
+        game.new_game()
+        
         test_bid_creation()
+        test_from_string_cache()
         test_bid_comparison()
-        test_bid_validation()
-        test_bidding_sequence()
-        test_all_pass()
-        test_complex_bidding()
+        test_bid_validation(game)
+        test_bidding_sequence(game)
+        test_all_pass(game)
+        test_complex_bidding(game)
         
         logger.info("\nALL BIDDING TESTS PASSED")
     except AssertionError as e:
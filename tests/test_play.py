@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for card play in the Bridge game.
+
+This script tests:
+1. Suit counts kept in step with the hands during play
+2. Follow-suit rules, including a player void in the led suit
+"""
+
+import sys
+import os
+import logging
+
+# Add the parent directory to the path to allow importing the core modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Import the necessary modules
+from core.deck import Card
+from core.game import BridgeGame
+from core.hand_evaluation import count_suit_length
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("BridgeTest")
+
+def _start_play(game, hands):
+    """Give the players the given hands and start play with South on lead."""
+    for player, hand in zip(game.players, hands):
+        player["hand"] = hand
+        player["suit_counts"] = count_suit_length(hand)
+    game.current_state = "playing"
+    game.current_player = 0
+    game.last_trick_winner = None
+    game.trick = []
+
+def test_suit_counts_follow_play():
+    """Test that suit counts match the hands through a whole dealt hand."""
+    logger.info("\n=== TESTING SUIT COUNTS DURING PLAY ===")
+
+    game = BridgeGame()
+    game.new_game()
+
+    # Dealt counts match the dealt hands
+    for player in game.players:
+        assert player["suit_counts"] == count_suit_length(player["hand"])
+
+    # Play out the deal, always with the first legal card
+    game.current_state = "playing"
+    game.current_player = 0
+    for _ in range(52):
+        player_idx = game.current_player
+        player = game.players[player_idx]
+        if game.trick:
+            led_suit = game.trick[0]["card"].suit
+            card = next((c for c in player["hand"] if c.suit == led_suit), player["hand"][0])
+        else:
+            card = player["hand"][0]
+
+        assert game.play_card(player_idx, card), f"{card} by player {player_idx} should be legal"
+        assert player["suit_counts"] == count_suit_length(player["hand"])
+
+    assert game.current_state == "game_over"
+    assert all(sum(player["suit_counts"].values()) == 0 for player in game.players)
+
+    logger.info("Suit count tests passed")
+
+def test_follow_suit_with_void():
+    """Test that a player must follow suit, and may discard once void."""
+    logger.info("\n=== TESTING FOLLOW SUIT ===")
+
+    game = BridgeGame()
+    game.new_game()
+
+    # South holds twelve spades and a heart, West the last spade and the
+    # other hearts, North all the diamonds and East all the clubs
+    _start_play(game, [
+        [Card('S', value) for value in range(3, 15)] + [Card('H', 2)],
+        [Card('S', 2)] + [Card('H', value) for value in range(3, 15)],
+        [Card('D', value) for value in range(2, 15)],
+        [Card('C', value) for value in range(2, 15)],
+    ])
+
+    # South leads a spade
+    assert game.play_card(0, Card('S', 14))
+
+    # West still holds a spade, so a heart is not allowed
+    assert not game.play_card(1, Card('H', 14)), "West must follow suit with a spade"
+    assert game.play_card(1, Card('S', 2))
+    assert game.players[1]["suit_counts"]['S'] == 0
+
+    # North and East are void in spades, so any card is allowed
+    assert game.play_card(2, Card('D', 2))
+    assert game.play_card(3, Card('C', 2))
+    assert game.last_trick_winner == 0
+
+    # South leads a spade again; West is now void in spades and may discard
+    assert game.play_card(0, Card('S', 13))
+    assert game.play_card(1, Card('H', 3)), "West is void in spades and may discard"
+    assert game.players[1]["suit_counts"] == count_suit_length(game.players[1]["hand"])
+
+    logger.info("Follow suit tests passed")
+
+def main():
+    """Run all play tests."""
+    logger.info("STARTING PLAY TESTS")
+
+    try:
+        test_suit_counts_follow_play()
+        test_follow_suit_with_void()
+
+        logger.info("\nALL PLAY TESTS PASSED")
+    except AssertionError as e:
+        logger.error(f"TEST FAILED: {e}")
+    except Exception as e:
+        logger.error(f"ERROR DURING TESTS: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+
+if __name__ == "__main__":
+    main()